@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for the SEO Assistant API
+
+Usage:
+    gunicorn smart_seo_assistant_ace.api:app -c gunicorn.conf.py
+
+The app module is preloaded in the master so imported libraries are shared
+with the workers copy-on-write. Each worker still builds its own pipeline on
+startup, since HTTP sessions, caches and worker threads don't survive a fork.
+GEMINI_RPM and GEMINI_MAX_PARALLEL are read here as totals for the whole
+deployment and handed to each worker divided by the worker count.
+"""
+
+import os
+import multiprocessing
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Each worker paces Gemini calls on its own (GEMINI_RPM / GEMINI_MAX_PARALLEL
+# are per process), so split the deployment-wide budget between the workers
+gemini_rpm = int(os.getenv("GEMINI_RPM", 60))
+gemini_max_parallel = int(os.getenv("GEMINI_MAX_PARALLEL", 8))
+raw_env = [
+    f"GEMINI_RPM={max(1, gemini_rpm // workers)}",
+    f"GEMINI_MAX_PARALLEL={max(1, gemini_max_parallel // workers)}"
+]
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Full article generation can take well over the default 30s
+timeout = int(os.getenv("WORKER_TIMEOUT", 300))
+graceful_timeout = 30
+keepalive = 5
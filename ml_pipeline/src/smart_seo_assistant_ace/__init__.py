@@ -48,6 +48,7 @@ from .entity import (
     ContentType, SearchIntent
 )
 from .components.data_retrieval import DataRetriever
+from .components.async_data_retrieval import AsyncDataRetriever
 from .components.content_generation import ContentGenerator
 
 # Utility imports
@@ -58,6 +59,7 @@ __all__ = [
     "SEOAssistantPipeline",
     "ConfigurationManager",
     "DataRetriever", 
+    "AsyncDataRetriever",
     "ContentGenerator",
     
     # Data structures
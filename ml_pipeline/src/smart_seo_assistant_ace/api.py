@@ -4,28 +4,35 @@ Provides REST API endpoints for SEO content generation
 
 Usage:
     uvicorn smart_seo_assistant_ace.api:app --reload
+    gunicorn smart_seo_assistant_ace.api:app -c gunicorn.conf.py  # one worker per core
     
 Endpoints:
     GET /health - Health check
     POST /analyze - Analyze keyword
     POST /brief - Generate content brief
     POST /article - Generate full article
-    POST /bulk - Process multiple keywords
+    POST /bulk - Process multiple keywords (streams NDJSON results)
     POST /calendar - Create content calendar
+    POST /v1/batches - Submit a JSONL keyword batch job
+    GET /v1/batches/{batch_id} - Get batch job status
+    GET /v1/batches/{batch_id}/results - Download batch results (JSONL)
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse, FileResponse, StreamingResponse
+from typing import List, Optional, Dict, Any, Type, TypeVar, Callable, Tuple
+import msgspec
 import logging
 import asyncio
 from pathlib import Path
-import json
+import orjson
 
 from .config.configuration import ConfigurationManager
 from .pipeline.seo_pipeline import SEOAssistantPipeline
-from .entity import PipelineConfig
+from .components.semantic_cache import SemanticCache
+from .components.batch_runner import BatchRunner
+from .entity import PipelineConfig, SEOContext, dumps
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -33,7 +40,8 @@ app = FastAPI(
     description="AI-powered SEO content planning and generation API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -49,45 +57,154 @@ app.add_middleware(
 pipeline: Optional[SEOAssistantPipeline] = None
 
 
-# Pydantic models for API requests/responses
-class KeywordAnalysisRequest(BaseModel):
+class RequestCoalescer:
+    """
+    Coalesces concurrent identical requests into a single pipeline call
+    
+    Requests for the same (keyword, goal) that arrive while a call is in flight
+    await the same result instead of re-running retrieval and Gemini generation.
+    Calls run in worker threads, bounded by max_concurrency, so the event loop
+    stays responsive.
+    """
+    
+    def __init__(self, handler: Callable[[str, str], Any], max_concurrency: int):
+        self.handler = handler
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+    
+    async def submit(self, keyword: str, goal: str = "") -> Any:
+        """Run the handler for (keyword, goal), sharing any in-flight call"""
+        key = (keyword, goal)
+        task = self._inflight.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(self._run(keyword, goal))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled client does not cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _run(self, keyword: str, goal: str) -> Any:
+        async with self._semaphore:
+            return await asyncio.to_thread(self.handler, keyword, goal)
+
+
+# Per-endpoint coalescers, created with the pipeline on startup
+analyze_coalescer: Optional[RequestCoalescer] = None
+brief_coalescer: Optional[RequestCoalescer] = None
+article_coalescer: Optional[RequestCoalescer] = None
+
+# Dedicated worker for JSONL batch jobs
+batch_runner: Optional[BatchRunner] = None
+
+# Per-endpoint response caches for paraphrase-tolerant reuse of generated data
+response_caches: Dict[str, SemanticCache] = {}
+
+
+def analysis_data(context: SEOContext) -> Dict[str, Any]:
+    """Build /analyze response data from an SEO context"""
+    return {
+        "keyword": context.keyword,
+        "search_intent": context.search_intent,
+        "related_keywords": context.related_keywords[:15],
+        "content_opportunities": context.content_opportunities[:10],
+        "user_questions": context.user_questions[:10],
+        "wikipedia_sources": [
+            {
+                "title": data.title,
+                "url": data.url,
+                "relevance_score": data.relevance_score
+            } for data in context.wikipedia_data[:5]
+        ]
+    }
+
+
+async def cached_response_data(endpoint: str, coalescer: RequestCoalescer, keyword: str, goal: str,
+                               to_data: Callable[[Any], Dict[str, Any]] = lambda result: result.as_dict) -> Dict[str, Any]:
+    """Return the endpoint's response data from the semantic cache, generating it on a miss"""
+    cache = response_caches[endpoint]
+    
+    data = await asyncio.to_thread(cache.get, keyword, goal)
+    if data is None:
+        result = await coalescer.submit(keyword, goal)
+        data = to_data(result)
+        # Responses holding fallback text from a failed generation call are not reused
+        if not getattr(result, "used_fallback", False):
+            await asyncio.to_thread(cache.set, keyword, goal, data)
+    
+    return data
+
+
+# msgspec request models (decoded straight from the raw body, bypassing Pydantic)
+class KeywordAnalysisRequest(msgspec.Struct):
     keyword: str
     goal: Optional[str] = ""
 
 
-class ContentBriefRequest(BaseModel):
+class ContentBriefRequest(msgspec.Struct):
     keyword: str
     goal: Optional[str] = ""
 
 
-class FullArticleRequest(BaseModel):
+class FullArticleRequest(msgspec.Struct):
     keyword: str
     goal: Optional[str] = ""
 
 
-class BulkProcessRequest(BaseModel):
+class BulkProcessRequest(msgspec.Struct):
     keywords: List[str]
     goal: Optional[str] = ""
 
 
-class ContentCalendarRequest(BaseModel):
+class ContentCalendarRequest(msgspec.Struct):
     keywords: List[str]
     goal: Optional[str] = ""
     timeframe_weeks: Optional[int] = 4
 
 
-class ApiResponse(BaseModel):
-    success: bool
-    message: str
-    data: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+RequestModel = TypeVar("RequestModel", bound=msgspec.Struct)
+
+
+def request_body_schema(model: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """OpenAPI requestBody for a msgspec request model, for use as openapi_extra"""
+    _, components = msgspec.json.schema_components([model])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}}
+        }
+    }
+
+
+async def decode_request(http_request: Request, model: Type[RequestModel]) -> RequestModel:
+    """Decode and validate a JSON request body into a msgspec model"""
+    try:
+        return msgspec.json.decode(await http_request.body(), type=model)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def api_response(message: str, data: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
+    """
+    Build a successful API response envelope
+    
+    Returning the response directly skips FastAPI's response validation and
+    jsonable_encoder pass, so the payload is encoded once by orjson.
+    """
+    return ORJSONResponse({
+        "success": True,
+        "message": message,
+        "data": data,
+        "error": None
+    })
 
 
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize pipeline on startup"""
-    global pipeline
+    global pipeline, analyze_coalescer, brief_coalescer, article_coalescer, batch_runner
     
     try:
         # Setup logging
@@ -104,6 +221,22 @@ async def startup_event():
         
         # Initialize pipeline
         pipeline = SEOAssistantPipeline(config)
+        
+        analyze_coalescer = RequestCoalescer(pipeline.retrieve_context, config.max_concurrency)
+        brief_coalescer = RequestCoalescer(pipeline.generate_content_brief, config.max_concurrency)
+        article_coalescer = RequestCoalescer(pipeline.generate_full_article, config.max_concurrency)
+        
+        # Share one embedding model between the endpoint caches
+        analyze_cache = SemanticCache()
+        response_caches.update({
+            "analyze": analyze_cache,
+            "brief": SemanticCache(encoder=analyze_cache.encoder, model_name=None),
+            "article": SemanticCache(encoder=analyze_cache.encoder, model_name=None)
+        })
+        
+        batch_runner = BatchRunner(pipeline)
+        batch_runner.start()
+        
         logger.info("✅ SEO Assistant Pipeline initialized successfully!")
         
     except Exception as e:
@@ -114,8 +247,16 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    global pipeline
+    global pipeline, batch_runner
+    worker_stopped = True
+    if batch_runner:
+        worker_stopped = batch_runner.stop()
+        batch_runner = None
+    if pipeline and worker_stopped:
+        # A batch keyword still in flight keeps using the pipeline until it finishes
+        pipeline.close()
     pipeline = None
+    response_caches.clear()
 
 
 # API endpoints
@@ -124,139 +265,131 @@ async def health_check():
     """Health check endpoint"""
     global pipeline
     
-    return {
+    return ORJSONResponse({
         "status": "healthy" if pipeline else "unhealthy",
         "message": "SEO Assistant API is running" if pipeline else "Pipeline not initialized",
         "pipeline_stats": pipeline.get_pipeline_stats() if pipeline else None
-    }
+    })
 
 
-@app.post("/analyze", response_model=ApiResponse)
-async def analyze_keyword(request: KeywordAnalysisRequest):
+@app.post("/analyze", openapi_extra=request_body_schema(KeywordAnalysisRequest))
+async def analyze_keyword(http_request: Request):
     """Analyze a keyword and return insights"""
     global pipeline
     
+    request = await decode_request(http_request, KeywordAnalysisRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
     try:
-        # Get context
-        context = pipeline.retrieve_context(request.keyword, request.goal)
-        
-        # Prepare response data
-        analysis_data = {
-            "keyword": context.keyword,
-            "search_intent": context.search_intent,
-            "related_keywords": context.related_keywords[:15],
-            "content_opportunities": context.content_opportunities[:10],
-            "user_questions": context.user_questions[:10],
-            "wikipedia_sources": [
-                {
-                    "title": data.title,
-                    "url": data.url,
-                    "relevance_score": data.relevance_score
-                } for data in context.wikipedia_data[:5]
-            ]
-        }
+        # Get analysis (served from cache for repeated or paraphrased keywords)
+        analysis = await cached_response_data(
+            "analyze", analyze_coalescer, request.keyword, request.goal, analysis_data
+        )
         
-        return ApiResponse(
-            success=True,
-            message=f"Keyword analysis completed for '{request.keyword}'",
-            data=analysis_data
+        return api_response(
+            f"Keyword analysis completed for '{request.keyword}'",
+            analysis
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
-@app.post("/brief", response_model=ApiResponse)
-async def generate_content_brief(request: ContentBriefRequest):
+@app.post("/brief", openapi_extra=request_body_schema(ContentBriefRequest))
+async def generate_content_brief(http_request: Request):
     """Generate content brief for a keyword"""
     global pipeline
     
+    request = await decode_request(http_request, ContentBriefRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
     try:
         # Generate brief
-        brief = pipeline.generate_content_brief(request.keyword, request.goal)
+        brief = await cached_response_data("brief", brief_coalescer, request.keyword, request.goal)
         
-        return ApiResponse(
-            success=True,
-            message=f"Content brief generated for '{request.keyword}'",
-            data=brief.to_dict()
+        return api_response(
+            f"Content brief generated for '{request.keyword}'",
+            brief
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Brief generation failed: {str(e)}")
 
 
-@app.post("/article", response_model=ApiResponse)
-async def generate_full_article(request: FullArticleRequest):
+@app.post("/article", openapi_extra=request_body_schema(FullArticleRequest))
+async def generate_full_article(http_request: Request):
     """Generate full article for a keyword"""
     global pipeline
     
+    request = await decode_request(http_request, FullArticleRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
     try:
         # Generate article
-        article = pipeline.generate_full_article(request.keyword, request.goal)
+        article = await cached_response_data("article", article_coalescer, request.keyword, request.goal)
         
-        return ApiResponse(
-            success=True,
-            message=f"Full article generated for '{request.keyword}'",
-            data=article.to_dict()
+        return api_response(
+            f"Full article generated for '{request.keyword}'",
+            article
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Article generation failed: {str(e)}")
 
 
-@app.post("/bulk", response_model=ApiResponse)
-async def bulk_process_keywords(request: BulkProcessRequest):
-    """Process multiple keywords in bulk"""
+@app.post("/bulk", openapi_extra=request_body_schema(BulkProcessRequest))
+async def bulk_process_keywords(http_request: Request):
+    """
+    Process multiple keywords in bulk
+    
+    Streams NDJSON: one result line per keyword in completion order, then a
+    final {"summary": ...} line.
+    """
     global pipeline
     
+    request = await decode_request(http_request, BulkProcessRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
     if len(request.keywords) > 50:  # Limit bulk processing
         raise HTTPException(status_code=400, detail="Maximum 50 keywords allowed")
     
-    try:
-        # Process keywords
-        results = pipeline.bulk_process_keywords(request.keywords, request.goal)
+    async def stream_results():
+        successful = 0
         
-        # Calculate summary
-        successful = sum(1 for r in results if r["status"] == "success")
-        failed = len(results) - successful
+        async for result in pipeline.aiter_bulk_process_keywords(request.keywords, request.goal):
+            if result["status"] == "success":
+                successful += 1
+            yield dumps(result) + b"\n"
         
-        summary = {
-            "total_keywords": len(request.keywords),
-            "successful": successful,
-            "failed": failed,
-            "success_rate": successful / len(results) * 100 if results else 0
-        }
-        
-        return ApiResponse(
-            success=True,
-            message=f"Bulk processing completed: {successful}/{len(request.keywords)} successful",
-            data={
-                "summary": summary,
-                "results": results
+        # Final line summarizes the whole batch
+        total = len(request.keywords)
+        yield dumps({
+            "summary": {
+                "total_keywords": total,
+                "successful": successful,
+                "failed": total - successful,
+                "success_rate": successful / total * 100 if total else 0
             }
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Bulk processing failed: {str(e)}")
+        }) + b"\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
 
 
-@app.post("/calendar", response_model=ApiResponse)
-async def create_content_calendar(request: ContentCalendarRequest):
+@app.post("/calendar", openapi_extra=request_body_schema(ContentCalendarRequest))
+async def create_content_calendar(http_request: Request):
     """Create content calendar for keywords"""
     global pipeline
     
+    request = await decode_request(http_request, ContentCalendarRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
@@ -265,15 +398,15 @@ async def create_content_calendar(request: ContentCalendarRequest):
     
     try:
         # Generate calendar
-        calendar = pipeline.plan_content_calendar(
+        calendar = await asyncio.to_thread(
+            pipeline.plan_content_calendar,
             request.keywords, 
             request.timeframe_weeks
         )
         
-        return ApiResponse(
-            success=True,
-            message=f"Content calendar created for {len(request.keywords)} keywords over {request.timeframe_weeks} weeks",
-            data=calendar.to_dict()
+        return api_response(
+            f"Content calendar created for {len(request.keywords)} keywords over {request.timeframe_weeks} weeks",
+            calendar.as_dict
         )
         
     except Exception as e:
@@ -292,21 +425,75 @@ async def get_pipeline_stats():
         stats = pipeline.get_pipeline_stats()
         performance_report = pipeline.get_performance_report()
         
-        return {
+        return ORJSONResponse({
             "pipeline_stats": stats,
             "performance_report": performance_report
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
 
 
-# Background task endpoints
-@app.post("/bulk-async")
-async def bulk_process_async(request: BulkProcessRequest, background_tasks: BackgroundTasks):
+# Batch job endpoints
+@app.post("/v1/batches", status_code=202, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {"application/x-ndjson": {"schema": {"type": "string", "format": "binary"}}}
+    }
+})
+async def create_batch(http_request: Request):
+    """Submit a JSONL batch of {"keyword": ..., "goal": ...} lines for background processing"""
+    global batch_runner
+    
+    if not batch_runner:
+        raise HTTPException(status_code=500, detail="Pipeline not initialized")
+    
+    try:
+        status = batch_runner.submit(await http_request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    return ORJSONResponse(status, status_code=202)
+
+
+@app.get("/v1/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    """Get batch job status"""
+    global batch_runner
+    
+    if not batch_runner:
+        raise HTTPException(status_code=500, detail="Pipeline not initialized")
+    
+    status = batch_runner.get_status(batch_id)
+    if not status:
+        raise HTTPException(status_code=404, detail=f"Batch not found: {batch_id}")
+    
+    return ORJSONResponse(status)
+
+
+@app.get("/v1/batches/{batch_id}/results")
+async def get_batch_results(batch_id: str):
+    """Download batch results written so far (JSONL)"""
+    global batch_runner
+    
+    if not batch_runner:
+        raise HTTPException(status_code=500, detail="Pipeline not initialized")
+    
+    results_path = batch_runner.results_path(batch_id)
+    if not batch_runner.get_status(batch_id) or not results_path.exists():
+        raise HTTPException(status_code=404, detail=f"No results for batch: {batch_id}")
+    
+    return FileResponse(results_path, media_type="application/x-ndjson")
+
+
+# Background task endpoints (deprecated in favour of /v1/batches)
+@app.post("/bulk-async", deprecated=True, openapi_extra=request_body_schema(BulkProcessRequest))
+async def bulk_process_async(http_request: Request, background_tasks: BackgroundTasks):
     """Process keywords in background (for large batches)"""
     global pipeline
     
+    request = await decode_request(http_request, BulkProcessRequest)
+    
     if not pipeline:
         raise HTTPException(status_code=500, detail="Pipeline not initialized")
     
@@ -336,18 +523,18 @@ async def process_keywords_background(task_id: str, keywords: List[str], goal: s
     global pipeline
     
     try:
-        results = pipeline.bulk_process_keywords(keywords, goal)
+        results = await pipeline.abulk_process_keywords(keywords, goal)
         
         # Save results to file
         output_file = f"bulk_results_{task_id}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps({
                 "task_id": task_id,
                 "keywords": keywords,
                 "goal": goal,
                 "results": results,
                 "completed_at": str(asyncio.get_event_loop().time())
-            }, f, indent=2, ensure_ascii=False)
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logging.info(f"Background task {task_id} completed successfully")
         
@@ -11,23 +11,52 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
 from .config.configuration import ConfigurationManager
-from .pipeline.seo_pipeline import SEOAssistantPipeline
 from .entity import PipelineConfig
 from .utils import setup_logging
 
+# Above this many results, per-item details are only printed with --verbose
+VERBOSE_ITEM_THRESHOLD = 20
+
+
+def write_json(path, data) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available"""
+    if orjson:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_keywords(path) -> List[str]:
+    """Stream keywords from a file, one per line, dropping blanks and duplicates in order"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(dict.fromkeys(keyword for keyword in map(str.strip, f) if keyword))
+
+
+def render_section(title: str, items, fmt: str = "  {i}. {item}") -> str:
+    """Render a titled, numbered list as a single string"""
+    return "\n".join([title, *(fmt.format(i=i, item=item) for i, item in enumerate(items, 1))])
+
 
 class SEOAssistantCLI:
     """Command Line Interface for SEO Assistant Pipeline"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         """Initialize CLI"""
+        self.verbose = verbose
         self.setup_logging()
         self.config_manager = ConfigurationManager()
         self.pipeline = None
@@ -43,6 +72,10 @@ class SEOAssistantCLI:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _show_items(self, count: int) -> bool:
+        """Whether per-item details should be printed for a result set of this size"""
+        return self.verbose or count <= VERBOSE_ITEM_THRESHOLD
+    
     def initialize_pipeline(self) -> bool:
         """Initialize the SEO pipeline"""
         try:
@@ -54,6 +87,10 @@ class SEOAssistantCLI:
                 self.logger.error("   Get your key from: https://aistudio.google.com/app/apikey")
                 return False
             
+            # Imported here so --help and configuration errors don't pay for
+            # loading the Gemini SDK and retrieval dependencies
+            from .pipeline.seo_pipeline import SEOAssistantPipeline
+            
             self.pipeline = SEOAssistantPipeline(config)
             self.logger.info("✅ SEO Assistant Pipeline initialized successfully!")
             return True
@@ -74,30 +111,23 @@ class SEOAssistantCLI:
             context = self.pipeline.retrieve_context(keyword, goal)
             
             # Display analysis
-            print("\n" + "="*60)
-            print(f"🎯 KEYWORD ANALYSIS: {keyword}")
-            print("="*60)
-            
-            print(f"\n📊 Search Intent: {context.search_intent}")
-            
-            print(f"\n🔗 Related Keywords ({len(context.related_keywords)}):")
-            for i, kw in enumerate(context.related_keywords[:10], 1):
-                print(f"  {i}. {kw}")
-            
-            print(f"\n💡 Content Opportunities ({len(context.content_opportunities)}):")
-            for i, opp in enumerate(context.content_opportunities[:5], 1):
-                print(f"  {i}. {opp}")
-            
-            print(f"\n❓ User Questions ({len(context.user_questions)}):")
-            for i, q in enumerate(context.user_questions[:5], 1):
-                print(f"  {i}. {q}")
+            sections = [
+                "\n" + "="*60 + f"\n🎯 KEYWORD ANALYSIS: {keyword}\n" + "="*60,
+                f"\n📊 Search Intent: {context.search_intent}",
+                render_section(f"\n🔗 Related Keywords ({len(context.related_keywords)}):", context.related_keywords[:10]),
+                render_section(f"\n💡 Content Opportunities ({len(context.content_opportunities)}):", context.content_opportunities[:5]),
+                render_section(f"\n❓ User Questions ({len(context.user_questions)}):", context.user_questions[:5])
+            ]
             
             if context.wikipedia_data:
-                print(f"\n📚 Wikipedia Sources ({len(context.wikipedia_data)}):")
-                for i, data in enumerate(context.wikipedia_data[:3], 1):
-                    print(f"  {i}. {data.title} (Relevance: {data.relevance_score:.2f})")
+                sections.append(render_section(
+                    f"\n📚 Wikipedia Sources ({len(context.wikipedia_data)}):",
+                    context.wikipedia_data[:3],
+                    "  {i}. {item.title} (Relevance: {item.relevance_score:.2f})"
+                ))
             
-            print("\n✅ Analysis complete!")
+            sections.append("\n✅ Analysis complete!")
+            print("\n".join(sections))
             
         except Exception as e:
             self.logger.error(f"❌ Analysis failed: {e}")
@@ -114,32 +144,23 @@ class SEOAssistantCLI:
             brief = self.pipeline.generate_content_brief(keyword, goal)
             
             # Display brief
-            print("\n" + "="*60)
-            print(f"📝 CONTENT BRIEF: {keyword}")
-            print("="*60)
-            
-            print(f"\n🏷️  Title: {brief.title}")
-            print(f"📄 Meta Description: {brief.meta_description}")
-            print(f"📊 Target Word Count: {brief.word_count_target}")
-            print(f"🎯 Content Type: {brief.content_type}")
-            
-            print(f"\n📖 Content Outline:")
-            for i, section in enumerate(brief.content_outline, 1):
-                print(f"  {i}. {section}")
-            
-            print(f"\n🔍 SEO Keywords:")
-            for i, kw in enumerate(brief.seo_keywords[:10], 1):
-                print(f"  {i}. {kw}")
-            
-            print(f"\n📢 Call to Action: {brief.call_to_action}")
+            print("\n".join([
+                "\n" + "="*60 + f"\n📝 CONTENT BRIEF: {keyword}\n" + "="*60,
+                f"\n🏷️  Title: {brief.title}",
+                f"📄 Meta Description: {brief.meta_description}",
+                f"📊 Target Word Count: {brief.word_count_target}",
+                f"🎯 Content Type: {brief.content_type}",
+                render_section("\n📖 Content Outline:", brief.content_outline),
+                render_section("\n🔍 SEO Keywords:", brief.seo_keywords[:10]),
+                f"\n📢 Call to Action: {brief.call_to_action}"
+            ]))
             
             # Save to file if requested
             if output_file:
                 output_path = Path(output_file)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(brief.to_dict(), f, indent=2, ensure_ascii=False)
+                write_json(output_path, brief.as_dict)
                 
                 print(f"\n💾 Brief saved to: {output_path}")
             
@@ -160,25 +181,20 @@ class SEOAssistantCLI:
             article = self.pipeline.generate_full_article(keyword, goal)
             
             # Display article info
-            print("\n" + "="*60)
-            print(f"📚 FULL ARTICLE: {keyword}")
-            print("="*60)
-            
-            print(f"\n🏷️  Title: {article.title}")
-            print(f"📄 Meta Description: {article.meta_description}")
-            print(f"📊 Total Words: {article.total_word_count}")
-            
-            print(f"\n📖 Article Structure:")
-            for section in article.sections:
-                print(f"  • {section.heading} ({section.word_count} words)")
+            print("\n".join([
+                "\n" + "="*60 + f"\n📚 FULL ARTICLE: {keyword}\n" + "="*60,
+                f"\n🏷️  Title: {article.title}",
+                f"📄 Meta Description: {article.meta_description}",
+                f"📊 Total Words: {article.total_word_count}",
+                render_section("\n📖 Article Structure:", article.sections, "  • {item.heading} ({item.word_count} words)")
+            ]))
             
             # Save to file if requested
             if output_file:
                 output_path = Path(output_file)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(article.to_dict(), f, indent=2, ensure_ascii=False)
+                write_json(output_path, article.as_dict)
                 
                 print(f"\n💾 Article saved to: {output_path}")
             else:
@@ -206,8 +222,7 @@ class SEOAssistantCLI:
                 self.logger.error(f"❌ Keywords file not found: {keywords_file}")
                 return
             
-            with open(keywords_path, 'r', encoding='utf-8') as f:
-                keywords = [line.strip() for line in f if line.strip()]
+            keywords = read_keywords(keywords_path)
             
             if not keywords:
                 self.logger.error("❌ No keywords found in file")
@@ -218,30 +233,37 @@ class SEOAssistantCLI:
             # Process keywords
             results = self.pipeline.bulk_process_keywords(keywords, goal)
             
-            # Display results
-            print("\n" + "="*60)
-            print(f"📦 BULK PROCESSING RESULTS")
-            print("="*60)
-            
+            # Display results (built up and written at once rather than printed per line)
             successful = sum(1 for r in results if r["status"] == "success")
             failed = len(results) - successful
             
-            print(f"\n📊 Summary:")
-            print(f"  ✅ Successful: {successful}")
-            print(f"  ❌ Failed: {failed}")
-            print(f"  📈 Success Rate: {successful/len(results)*100:.1f}%")
+            lines = [
+                "",
+                "="*60,
+                "📦 BULK PROCESSING RESULTS",
+                "="*60,
+                "",
+                "📊 Summary:",
+                f"  ✅ Successful: {successful}",
+                f"  ❌ Failed: {failed}",
+                f"  📈 Success Rate: {successful/len(results)*100:.1f}%"
+            ]
+            
+            if self._show_items(len(results)):
+                lines.append("\n📝 Generated Content Briefs:")
+                lines.extend(
+                    f"  {i}. {result['keyword']} → {result['title']}" if result["status"] == "success"
+                    else f"  {i}. {result['keyword']} → ❌ {result['error']}"
+                    for i, result in enumerate(results, 1)
+                )
+            else:
+                lines.append(f"\n📝 {len(results)} content briefs generated (use --verbose to list them)")
             
-            print(f"\n📝 Generated Content Briefs:")
-            for i, result in enumerate(results, 1):
-                if result["status"] == "success":
-                    print(f"  {i}. {result['keyword']} → {result['title']}")
-                else:
-                    print(f"  {i}. {result['keyword']} → ❌ {result['error']}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
             # Save results
             output_file = keywords_path.stem + "_results.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            write_json(output_file, results)
             
             print(f"\n💾 Results saved to: {output_file}")
             
@@ -265,26 +287,36 @@ class SEOAssistantCLI:
             # Generate calendar
             calendar = self.pipeline.plan_content_calendar(keywords, weeks)
             
-            # Display calendar
-            print("\n" + "="*60)
-            print(f"📅 CONTENT CALENDAR ({weeks} weeks)")
-            print("="*60)
+            # Display calendar (built up and written at once rather than printed per line)
+            lines = [
+                "",
+                "="*60,
+                f"📅 CONTENT CALENDAR ({weeks} weeks)",
+                "="*60
+            ]
             
-            for week in range(1, weeks + 1):
-                week_items = [item for item in calendar.items if item.target_week == week]
+            show_items = self._show_items(len(keywords))
+            for week in sorted(calendar.schedule, key=itemgetter("week")):
+                week_items = week["items"]
+                lines.append(f"\n📅 Week {week['week']} ({len(week_items)} items):")
+                
+                if not show_items:
+                    lines.append(f"  Focus keyword: {week['focus_keyword']}")
+                    continue
                 
-                if week_items:
-                    print(f"\n📅 Week {week} ({len(week_items)} items):")
-                    for item in week_items:
-                        print(f"  • {item.title} ({item.content_type})")
-                        print(f"    Keyword: {item.keyword}")
-                        print(f"    Priority: {item.priority_score:.1f} | Difficulty: {item.estimated_difficulty}")
-                        print()
+                for item in week_items:
+                    lines.extend([
+                        f"  • {item['title']} ({item['content_type']})",
+                        f"    Keyword: {item['keyword']}",
+                        f"    Priority: {item['priority_score']:.1f} | Difficulty: {item['estimated_difficulty']}",
+                        ""
+                    ])
+            
+            sys.stdout.write("\n".join(lines) + "\n")
             
             # Save calendar
             calendar_file = f"content_calendar_{weeks}weeks.json"
-            with open(calendar_file, 'w', encoding='utf-8') as f:
-                json.dump(calendar.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json(calendar_file, calendar.as_dict)
             
             print(f"💾 Calendar saved to: {calendar_file}")
             print("\n✅ Content calendar created successfully!")
@@ -332,6 +364,7 @@ Examples:
     bulk_parser.add_argument('--goal', default='', help='User goal or context')
     bulk_parser.add_argument('--calendar', action='store_true', help='Create content calendar')
     bulk_parser.add_argument('--weeks', type=int, default=4, help='Calendar timeframe in weeks')
+    bulk_parser.add_argument('--verbose', action='store_true', help='List every result, even for large batches')
     
     # Parse arguments
     args = parser.parse_args()
@@ -341,7 +374,7 @@ Examples:
         return
     
     # Initialize CLI
-    cli = SEOAssistantCLI()
+    cli = SEOAssistantCLI(verbose=getattr(args, 'verbose', False))
     
     if not cli.initialize_pipeline():
         sys.exit(1)
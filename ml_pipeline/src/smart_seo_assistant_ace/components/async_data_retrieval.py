@@ -0,0 +1,176 @@
+"""
+Async Data Retrieval Component for SEO Assistant Pipeline
+Fetches Wikipedia data over aiohttp so many keyword lookups overlap on one event loop
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .data_retrieval import DataRetriever, orjson
+from ..entity import SEOContext, WikipediaResult
+from ..utils import retry_with_backoff
+from ..constants import (
+    WIKIPEDIA_RESULTS_LIMIT, DEFAULT_TIMEOUT, MAX_RETRIES, MAX_CONCURRENCY,
+    HTTP_USER_AGENT, WIKIPEDIA_API_URL, MAX_CACHE_SIZE
+)
+
+
+class AsyncDataRetriever(DataRetriever):
+    """
+    DataRetriever with coroutine variants of the network calls
+    
+    The aiohttp session is created lazily on first use, so it is bound to the
+    event loop that actually awaits it. The synchronous methods are inherited
+    unchanged for callers outside an event loop.
+    """
+    
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES,
+                 pool_size: int = MAX_CONCURRENCY, session: Optional["requests.Session"] = None,
+                 cache_size: int = MAX_CACHE_SIZE):
+        """
+        Initialize async data retriever
+        
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts for failed requests
+            pool_size: Maximum simultaneous connections per host
+            session: Optional pre-configured requests session for the sync methods
+            cache_size: Contexts memoized per (keyword, user_goal) for CONTEXT_CACHE_TTL (0 disables)
+        """
+        super().__init__(timeout=timeout, max_retries=max_retries, pool_size=pool_size, session=session,
+                         cache_size=cache_size)
+        
+        self.client: Optional["aiohttp.ClientSession"] = None
+        
+        if not aiohttp:
+            self.logger.warning("aiohttp not available, async retrieval will fall back to worker threads")
+    
+    def _get_client(self) -> "aiohttp.ClientSession":
+        """Get the shared aiohttp session, creating it on the running loop"""
+        if self.client is None or self.client.closed:
+            self.client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_size, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip"}
+            )
+        return self.client
+    
+    async def aclose(self):
+        """Close the aiohttp session and the pooled sync connections"""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        return False
+    
+    async def afetch_wikipedia_data(self, keyword: str, limit: int = WIKIPEDIA_RESULTS_LIMIT) -> List[WikipediaResult]:
+        """
+        Fetch Wikipedia articles related to the keyword without blocking the event loop
+        
+        Args:
+            keyword: Search keyword
+            limit: Maximum number of results
+        
+        Returns:
+            List of WikipediaResult objects (empty if the fetch still fails after retries)
+        """
+        if not aiohttp:
+            return await asyncio.to_thread(self.fetch_wikipedia_data, keyword, limit)
+        
+        self.logger.info("Fetching Wikipedia data for: %s", keyword)
+        
+        try:
+            results = await self._afetch_wikipedia_data(keyword, limit)
+        except Exception as e:
+            self.logger.error("Failed to fetch Wikipedia data: %s", e)
+            return []
+        
+        self.logger.info("Retrieved %d Wikipedia results", len(results))
+        return results
+    
+    @retry_with_backoff(max_retries=3)
+    async def _afetch_wikipedia_data(self, keyword: str, limit: int) -> List[WikipediaResult]:
+        """Fetch and parse Wikipedia search results, raising on failure so 429/5xx responses are retried"""
+        # Revalidate any previous response for this search
+        cache_key = (keyword, limit)
+        params = self._wikipedia_search_params(keyword, limit)
+        
+        data, headers = await self._asearch(params, self._conditional_headers(cache_key))
+        if data is None:
+            results = self._revalidated_results(cache_key)
+            if results is not None:
+                return results
+            # Entry was evicted meanwhile; fetch unconditionally
+            data, headers = await self._asearch(params)
+        
+        results = self._parse_wikipedia_results(keyword, data)
+        self._store_validators(cache_key, headers, results)
+        return results
+    
+    async def _asearch(self, params: Dict, headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[Dict], Dict]:
+        """
+        Run a Wikipedia search request
+        
+        Returns:
+            Tuple of (decoded JSON, or None on 304 Not Modified, response headers)
+        """
+        async with self._get_client().get(WIKIPEDIA_API_URL, params=params, headers=headers) as response:
+            if response.status == 304:
+                return None, response.headers
+            
+            response.raise_for_status()
+            data = orjson.loads(await response.read()) if orjson else await response.json()
+            return data, response.headers
+    
+    async def afetch_wikipedia_data_bulk(self, keywords: List[str],
+                                         limit: int = WIKIPEDIA_RESULTS_LIMIT) -> Dict[str, List[WikipediaResult]]:
+        """
+        Fetch Wikipedia articles for many keywords concurrently
+        
+        Args:
+            keywords: Search keywords (duplicates are fetched once)
+            limit: Maximum number of results per keyword
+        
+        Returns:
+            Mapping of keyword to its WikipediaResult list
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        
+        results = await asyncio.gather(
+            *(self.afetch_wikipedia_data(keyword, limit) for keyword in unique_keywords),
+            return_exceptions=True
+        )
+        
+        return {
+            keyword: [] if isinstance(result, BaseException) else result
+            for keyword, result in zip(unique_keywords, results)
+        }
+    
+    async def aget_comprehensive_contexts(self, keywords: List[str], user_goal: str = "") -> Dict[str, SEOContext]:
+        """
+        Get comprehensive context for many keywords, fetching Wikipedia data concurrently
+        
+        Args:
+            keywords: Primary keywords
+            user_goal: User's goal or additional context
+        
+        Returns:
+            Mapping of keyword to its SEOContext
+        """
+        wikipedia_data = await self.afetch_wikipedia_data_bulk(keywords)
+        
+        return {
+            keyword: self.get_comprehensive_context(keyword, user_goal, wikipedia_results=results)
+            for keyword, results in wikipedia_data.items()
+        }
@@ -0,0 +1,297 @@
+"""
+Batch Runner Component for SEO Assistant Pipeline
+Runs large JSONL keyword jobs on a dedicated worker, persisting progress to disk
+"""
+
+import os
+import uuid
+import queue
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import msgspec
+import orjson
+
+from ..entity import dumps
+from ..constants import BATCH_DIR, BATCH_STATUS_INTERVAL, BATCH_POLL_INTERVAL
+
+
+class BatchItem(msgspec.Struct):
+    """Single line of a JSONL batch input file"""
+    keyword: str
+    goal: str = ""
+
+
+class BatchRunner:
+    """
+    Processes JSONL keyword batches on a single background worker thread
+    
+    Each batch lives in its own directory holding the input, incremental JSONL
+    results and a status file. Batches that were queued or running when the
+    process stopped are resumed on start, skipping already written results.
+    
+    When several API workers share a batch directory, only the one holding the
+    directory lock runs batches; it picks up batches submitted through the
+    other workers by polling for queued status files.
+    """
+    
+    def __init__(self, pipeline, batch_dir: str = BATCH_DIR):
+        """
+        Initialize batch runner
+        
+        Args:
+            pipeline: SEOAssistantPipeline used to process keywords
+            batch_dir: Directory where batch inputs, results and status are stored
+        """
+        self.pipeline = pipeline
+        self.batch_dir = Path(batch_dir)
+        self.logger = logging.getLogger(__name__)
+        
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._lock_file = None
+        self._scheduled: Set[str] = set()
+    
+    def start(self):
+        """Start the worker and re-enqueue unfinished batches if this process owns the batch directory"""
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        
+        if not self._acquire_lock():
+            self.logger.info("Batch directory is owned by another worker; only accepting submissions")
+            return
+        
+        self._enqueue_pending(resume=True)
+        
+        self._stopping.clear()
+        self._worker = threading.Thread(target=self._work, name="batch-runner", daemon=True)
+        self._worker.start()
+    
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        Ask the worker to stop after the keyword it is processing
+        
+        The interrupted batch stays "running" on disk and is resumed by the
+        next owner. The directory lock is only released once the worker has
+        exited, so another process can't run the same batch concurrently; if
+        the worker is still busy after timeout, it releases the lock itself
+        when it finishes.
+        
+        Returns:
+            True if the worker has exited, False if it is still finishing a keyword
+        """
+        if self._worker:
+            self._stopping.set()
+            self._queue.put(None)
+            self._worker.join(timeout)
+            if self._worker.is_alive():
+                self.logger.warning("Batch worker still busy after %.1fs; it will release the lock when done", timeout)
+                return False
+            self._worker = None
+        
+        self._release_lock()
+        return True
+    
+    def _acquire_lock(self) -> bool:
+        """Take the non-blocking batch directory lock, so one process runs batches"""
+        if fcntl is None:
+            return True
+        
+        lock_file = open(self.batch_dir / "runner.lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        
+        self._lock_file = lock_file
+        return True
+    
+    def _release_lock(self):
+        """Release the batch directory lock if this process holds it"""
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
+    
+    def _enqueue_pending(self, resume: bool = False):
+        """Enqueue batches that are waiting on disk but not yet scheduled in this process"""
+        pending = ("queued", "running") if resume else ("queued",)
+        
+        for status_file in sorted(self.batch_dir.glob("*/status.json")):
+            status = orjson.loads(status_file.read_bytes())
+            if status["status"] in pending and status["id"] not in self._scheduled:
+                if resume:
+                    self.logger.info("Resuming batch %s", status["id"])
+                self._scheduled.add(status["id"])
+                self._queue.put(status["id"])
+    
+    def submit(self, body: bytes) -> Dict[str, Any]:
+        """
+        Validate a JSONL batch and enqueue it
+        
+        Args:
+            body: JSONL bytes, one {"keyword": ..., "goal": ...} object per line
+        
+        Returns:
+            Initial batch status
+        
+        Raises:
+            ValueError: If a line is not a valid batch item or the batch is empty
+        """
+        items: List[BatchItem] = []
+        for line_number, line in enumerate(body.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                items.append(msgspec.json.decode(line, type=BatchItem))
+            except (msgspec.ValidationError, msgspec.DecodeError) as e:
+                raise ValueError(f"Invalid batch item on line {line_number}: {e}")
+        
+        if not items:
+            raise ValueError("Batch contains no keywords")
+        
+        batch_id = uuid.uuid4().hex
+        batch_path = self.batch_dir / batch_id
+        batch_path.mkdir(parents=True)
+        
+        with open(batch_path / "input.jsonl", "wb") as f:
+            for item in items:
+                f.write(msgspec.json.encode(item) + b"\n")
+        
+        status = {
+            "id": batch_id,
+            "status": "queued",
+            "total": len(items),
+            "processed": 0,
+            "successful": 0,
+            "failed": 0,
+            "created_at": datetime.now().isoformat(),
+            "completed_at": None,
+            "error": None
+        }
+        self._write_status(status)
+        if self._worker:
+            self._scheduled.add(batch_id)
+            self._queue.put(batch_id)
+        
+        return status
+    
+    def get_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a batch, or None if it does not exist"""
+        if not batch_id.isalnum():
+            return None
+        
+        status_file = self.batch_dir / batch_id / "status.json"
+        if not status_file.is_file():
+            return None
+        return orjson.loads(status_file.read_bytes())
+    
+    def results_path(self, batch_id: str) -> Path:
+        """Path of the JSONL results file for a batch"""
+        return self.batch_dir / batch_id / "results.jsonl"
+    
+    def _write_status(self, status: Dict[str, Any]):
+        """Atomically write a batch status file"""
+        status_file = self.batch_dir / status["id"] / "status.json"
+        tmp_file = status_file.with_suffix(".tmp")
+        tmp_file.write_bytes(orjson.dumps(status))
+        os.replace(tmp_file, status_file)
+    
+    def _work(self):
+        try:
+            self._process_queue()
+        finally:
+            if self._stopping.is_set():
+                self._release_lock()
+    
+    def _process_queue(self):
+        while True:
+            try:
+                batch_id = self._queue.get(timeout=BATCH_POLL_INTERVAL)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                self._enqueue_pending()
+                continue
+            
+            if batch_id is None or self._stopping.is_set():
+                return
+            
+            try:
+                self._run(batch_id)
+            except Exception as e:
+                self.logger.error("Batch %s failed: %s", batch_id, e)
+                status = self.get_status(batch_id)
+                if status:
+                    status.update(status="failed", error=str(e), completed_at=datetime.now().isoformat())
+                    self._write_status(status)
+            finally:
+                self._scheduled.discard(batch_id)
+    
+    def _run(self, batch_id: str):
+        status = self.get_status(batch_id)
+        results_file = self.results_path(batch_id)
+        
+        # Count results already written by a previous run so they are skipped
+        successful = failed = 0
+        if results_file.exists():
+            with open(results_file, "r+b") as f:
+                complete_size = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Write cut short when the process died; that keyword is processed again
+                        self.logger.warning("Dropping partial result line in batch %s", batch_id)
+                        f.truncate(complete_size)
+                        break
+                    complete_size += len(line)
+                    
+                    if orjson.loads(line)["status"] == "success":
+                        successful += 1
+                    else:
+                        failed += 1
+        processed = successful + failed
+        
+        status.update(status="running", processed=processed, successful=successful, failed=failed)
+        self._write_status(status)
+        self.logger.info("📦 Running batch %s (%d/%d already processed)", batch_id, processed, status["total"])
+        
+        with open(self.batch_dir / batch_id / "input.jsonl", "rb") as src, open(results_file, "ab") as out:
+            for index, line in enumerate(src):
+                if index < processed:
+                    continue
+                
+                if self._stopping.is_set():
+                    # Leave the batch "running" so the next owner resumes it here
+                    self._write_status(status)
+                    self.logger.info("Batch %s paused at %d/%d", batch_id, status["processed"], status["total"])
+                    return
+                
+                item = msgspec.json.decode(line, type=BatchItem)
+                result = self.pipeline.process_bulk_keyword(item.keyword, item.goal)
+                
+                if result["status"] != "success" and self._stopping.is_set():
+                    # Likely caused by shutdown tearing down the pipeline; leave the
+                    # keyword unrecorded so the next owner processes it again
+                    self._write_status(status)
+                    self.logger.info("Batch %s paused at %d/%d", batch_id, status["processed"], status["total"])
+                    return
+                
+                out.write(dumps(result) + b"\n")
+                out.flush()
+                
+                status["processed"] += 1
+                status["successful" if result["status"] == "success" else "failed"] += 1
+                if status["processed"] % BATCH_STATUS_INTERVAL == 0:
+                    self._write_status(status)
+        
+        status.update(status="completed", completed_at=datetime.now().isoformat())
+        self._write_status(status)
+        self.logger.info("📊 Batch %s completed: %d/%d successful", batch_id, status["successful"], status["total"])
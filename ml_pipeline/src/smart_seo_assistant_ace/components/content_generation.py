@@ -3,19 +3,43 @@ AI Content Generation Component for SEO Assistant Pipeline
 Handles content generation using Google Gemini API
 """
 
+import re
+import json
 import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_EXCEPTION
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
 try:
     import google.generativeai as genai
 except ImportError:
     genai = None
 
+try:
+    from google.api_core import exceptions as google_exceptions
+    # Errors no retry can fix (bad key, missing model, rejected request)
+    PERMANENT_GENERATION_ERRORS = (
+        google_exceptions.Unauthenticated,
+        google_exceptions.PermissionDenied,
+        google_exceptions.InvalidArgument,
+        google_exceptions.NotFound
+    )
+except ImportError:
+    PERMANENT_GENERATION_ERRORS = ()
+
 from ..entity import SEOContext, ContentBrief, ContentSection, FullArticle, ContentType
-from ..utils import retry_with_backoff, validate_seo_elements, estimate_reading_time
+from ..utils import retry_with_backoff, validate_seo_elements, estimate_reading_time, RateLimiter
 from ..constants import (
     GEMINI_MODEL_NAME, 
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_TRANSPORT,
+    GENERATION_CONCURRENCY,
+    GEMINI_MAX_PARALLEL,
+    GENERATION_CACHE_SIZE,
     DEFAULT_WORD_COUNT_TARGET, 
     MIN_WORD_COUNT, 
     MAX_WORD_COUNT,
@@ -23,30 +47,223 @@ from ..constants import (
     TITLE_OPTIMAL_LENGTH
 )
 
+FIRST_NUMBER_RE = re.compile(r'\d+')
+QUOTE_STRIP_TABLE = str.maketrans("", "", "\"'")
+
+# Fallback content used when a Gemini call fails
+FALLBACK_TITLE = "The Complete Guide to {keyword_title}"
+FALLBACK_META_DESCRIPTION = "Learn everything about {keyword} in this comprehensive guide. Expert tips, best practices, and actionable insights."
+FALLBACK_OUTLINE = (
+    "1. Introduction",
+    "2. What is {keyword_title}",
+    "3. Benefits and Importance",
+    "4. Best Practices",
+    "5. Common Mistakes to Avoid",
+    "6. Tools and Resources",
+    "7. Conclusion"
+)
+FALLBACK_SECTION = "Content for {section_title} section would be generated here. This section would cover key aspects of {keyword} related to {section_title_lower}."
+FALLBACK_INTRODUCTION = "In this comprehensive guide, we'll explore everything you need to know about {keyword}. Whether you're a beginner or looking to advance your knowledge, this article will provide valuable insights and practical tips."
+FALLBACK_CONCLUSION = "Understanding {keyword} is essential for success in today's digital landscape. By implementing the strategies and best practices outlined in this guide, you'll be well-equipped to achieve your goals. Start applying these insights today and see the difference they can make."
+
+# Fixed task rubrics, sent as each task model's system instruction so user
+# prompts only carry the per-request context and can share a cached prefix
+SECTION_REQUIREMENTS = """
+1. Provide actionable, valuable information
+2. Include the target keyword naturally (don't over-optimize)
+3. Use clear, engaging language
+4. Include specific examples where relevant
+5. Break up text with bullet points or numbered lists when appropriate
+6. Make it scannable and readable"""
+
+SYSTEM_INSTRUCTIONS = {
+    "title": f"""You write SEO-optimized blog post titles. Given an SEO context, generate a title that:
+1. Includes the primary keyword naturally
+2. Is compelling and click-worthy
+3. Is {TITLE_OPTIMAL_LENGTH} characters or less
+4. Matches the search intent
+5. Stands out from competitors
+
+Consider the user goal and target audience.
+Respond with ONLY the title, no explanations or quotes.""",
+    "meta_description": f"""You write SEO meta descriptions. Given an SEO context and a title, generate a meta description that:
+1. Is 120-{META_DESCRIPTION_MAX_LENGTH} characters
+2. Includes the primary keyword naturally
+3. Is compelling and action-oriented
+4. Summarizes the value proposition
+5. Encourages clicks
+
+Respond with ONLY the meta description, no explanations.""",
+    "outline": """You plan SEO blog posts. Given an SEO context and a title, create a detailed blog post outline with:
+1. Introduction (hook, problem, preview)
+2. 5-7 main sections (H2 level)
+3. 2-3 subsections per main section (H3 level)
+4. Conclusion with CTA
+
+Make it logical, comprehensive, and SEO-friendly.
+Address the user questions and content opportunities.
+
+Format as a numbered list with clear hierarchy.
+Use "1.", "2." for main sections and "a.", "b." for subsections.""",
+    "word_count": f"""You size SEO content. Given an SEO context, decide the optimal word count based on the search intent, topic complexity, and competitive landscape.
+
+Consider:
+- Search intent type (informational content typically needs more depth)
+- Topic complexity and breadth
+- User expectations
+- Competitive requirements
+
+Respond with just a number between {MIN_WORD_COUNT} and {MAX_WORD_COUNT}.""",
+    "section": f"""You write sections of SEO articles. Requirements:{SECTION_REQUIREMENTS}
+
+Write ONLY the section content, no title or heading.""",
+    "sections": f"""You write the sections of SEO articles. Requirements for each section:{SECTION_REQUIREMENTS}
+
+Return a JSON array with one object per section title, in the same order:
+[{{"heading": "<section title>", "content": "<section content, no title or heading>"}}]
+Respond with ONLY valid JSON.""",
+    "introduction": """You write engaging article introductions. Requirements:
+- 150-200 words
+- Hook the reader immediately
+- Include the target keyword in the first sentence
+- Preview what the article will cover
+- Set clear expectations
+- Address the user's search intent""",
+    "conclusion": """You write compelling article conclusions. Requirements:
+- 150-200 words
+- Summarize key takeaways
+- Include a clear call-to-action
+- Reinforce the value provided
+- End with actionable next steps for the reader"""
+}
+
 
 class ContentGenerator:
     """Generates SEO-optimized content using Google Gemini AI"""
     
-    def __init__(self, api_key: str, model_name: str = GEMINI_MODEL_NAME):
+    def __init__(self, api_key: str, model_name: str = GEMINI_MODEL_NAME,
+                 requests_per_minute: int = GEMINI_REQUESTS_PER_MINUTE,
+                 max_parallel_calls: int = GENERATION_CONCURRENCY,
+                 cache_size: int = GENERATION_CACHE_SIZE,
+                 max_in_flight: int = GEMINI_MAX_PARALLEL):
         """
         Initialize content generator
         
         Args:
             api_key: Google Gemini API key
             model_name: Gemini model to use
+            requests_per_minute: Gemini request quota to pace calls to (0 disables)
+            max_parallel_calls: Maximum independent Gemini calls in flight at once
+            cache_size: Number of generated texts cached by exact prompt (0 disables)
+            max_in_flight: Maximum Gemini requests in flight across all callers
         """
         self.api_key = api_key
         self.model_name = model_name
         self.logger = logging.getLogger(__name__)
+        self.rate_limiter = RateLimiter(requests_per_minute, 60.0)
+        
+        # Caps concurrent requests from every thread (fan-out pool, API workers,
+        # bulk runs) so bursts queue here instead of turning into 429 retries
+        self.max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        
+        # Fans out independent prompts; tasks never submit to the pool themselves
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel_calls, thread_name_prefix="gemini")
+        
+        # Exact-prompt LRU of generated texts, keyed by a hash of model + prompt
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         if not genai:
             raise ImportError("google-generativeai package not installed")
         
-        # Configure Gemini
-        genai.configure(api_key=api_key)
+        # Configure Gemini, with one model per task carrying that task's rubric.
+        # All models share the SDK's process-wide client, so with the grpc
+        # transport parallel calls are multiplexed over one HTTP/2 channel
+        # rather than each opening a new TLS connection.
+        genai.configure(api_key=api_key, transport=GEMINI_TRANSPORT)
         self.model = genai.GenerativeModel(model_name)
+        self.task_models = {
+            task: genai.GenerativeModel(model_name, system_instruction=instruction)
+            for task, instruction in SYSTEM_INSTRUCTIONS.items()
+        }
+        
+        self.logger.info("ContentGenerator initialized with model: %s", model_name)
+    
+    def close(self):
+        """Shut down the worker threads used for parallel Gemini calls"""
+        self._executor.shutdown(wait=False)
+    
+    def _generate(self, prompt: str, task: Optional[str] = None, json_output: bool = False,
+                  max_chars: Optional[int] = None, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Generate text for a prompt, serving repeated prompts from the cache
+        
+        Gemini calls are paced to the configured per-minute quota. Failed calls
+        raise and are never cached. With task, the model carrying that task's
+        system instruction is used. With json_output, Gemini is asked for a
+        JSON response body. With max_chars, the response is streamed and
+        reading stops once that many characters have arrived. With parse, the
+        parsed text is returned, and a response that parse rejects (by raising)
+        is not cached, so the next call asks Gemini again.
+        """
+        mime_type = "application/json" if json_output else "text/plain"
+        key = hashlib.blake2b(f"{self.model_name}\x00{task}\x00{mime_type}\x00{max_chars}\x00{prompt}".encode("utf-8"),
+                              digest_size=16).hexdigest()
+        
+        with self._cache_lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+                return parse(text) if parse else text
+        
+        model = self.task_models[task] if task else self.model
+        generation_config = {"response_mime_type": mime_type} if json_output else None
+        with self._in_flight, self.rate_limiter:
+            if max_chars:
+                text = self._generate_streamed(model, prompt, generation_config, max_chars)
+            else:
+                text = model.generate_content(prompt, generation_config=generation_config).text
         
-        self.logger.info(f"ContentGenerator initialized with model: {model_name}")
+        result = parse(text) if parse else text
+        
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = text
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        return result
+    
+    def _generate_streamed(self, model, prompt: str, generation_config: Optional[Dict[str, Any]], max_chars: int) -> str:
+        """Stream a response, abandoning the rest of it once max_chars have been read"""
+        parts = []
+        length = 0
+        for chunk in model.generate_content(prompt, generation_config=generation_config, stream=True):
+            parts.append(chunk.text)
+            length += len(chunk.text)
+            if length >= max_chars:
+                break
+        return "".join(parts)
+    
+    def _wait_all(self, futures: List[Future]) -> List[Any]:
+        """
+        Wait for futures and return their results in order
+        
+        On the first exception, futures that have not started are cancelled
+        and the exception is raised, so a failure such as a rejected API key
+        doesn't keep spending calls on the rest of the batch.
+        """
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                for pending in not_done:
+                    pending.cancel()
+                raise future.exception()
+        
+        return [future.result() for future in futures]
     
     def _format_context_for_prompt(self, context: SEOContext) -> str:
         """
@@ -56,237 +273,204 @@ class ContentGenerator:
             context: SEO context data
             
         Returns:
-            Formatted context string
+            Formatted context string, memoized on the context
         """
-        wikipedia_summary = ""
-        for i, result in enumerate(context.wikipedia_data[:3], 1):
-            wikipedia_summary += f"\n{i}. {result.title}: {result.snippet[:200]}..."
-        
-        formatted_context = f"""
-        === SEO CONTEXT FOR "{context.keyword.upper()}" ===
-        
-        PRIMARY KEYWORD: {context.keyword}
-        USER GOAL: {context.user_goal or "Generate comprehensive SEO content"}
-        SEARCH INTENT: {context.search_intent}
-        
-        KNOWLEDGE BASE:{wikipedia_summary}
-        
-        RELATED KEYWORDS: {', '.join(context.related_keywords[:8])}
-        
-        CONTENT OPPORTUNITIES:
-        {chr(10).join([f"- {opp}" for opp in context.content_opportunities[:6]])}
-        
-        USER QUESTIONS:
-        {chr(10).join([f"- {q}" for q in context.user_questions[:5]])}
+        return context.prompt_context
+    
+    def _with_fallback(self, task: str, generate: Callable[..., Any], fallback: Any, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Run a retried generation call, substituting fallback content once retries are exhausted
         
-        COMPETITIVE LANDSCAPE: {context.competitive_landscape}
+        Permanent errors (bad key, missing model, rejected request) are raised
+        instead, since fallback content would only hide them.
         
-        === END CONTEXT ===
+        Args:
+            task: Name of the generated field, for logging
+            generate: Generation method that raises on failure
+            fallback: Value returned if generation fails
+            
+        Returns:
+            Tuple of (generated or fallback value, whether the fallback was used)
         """
-        
-        return formatted_context
+        try:
+            return generate(*args, **kwargs), False
+        except PERMANENT_GENERATION_ERRORS:
+            raise
+        except Exception as e:
+            self.logger.error("Failed to generate %s: %s", task, e)
+            return fallback, True
     
-    @retry_with_backoff(max_retries=3)
-    def generate_title(self, context: SEOContext) -> str:
+    def generate_title(self, context: SEOContext, *, formatted_context: Optional[str] = None) -> str:
         """
         Generate SEO-optimized title
         
         Args:
             context: SEO context
+            formatted_context: Pre-formatted context, reused across calls for the same context
             
         Returns:
-            Generated title
+            Generated title, or a template title if generation fails
         """
-        self.logger.info(f"Generating title for: {context.keyword}")
+        title, _ = self._with_fallback("title", self._generate_title, FALLBACK_TITLE.format(keyword_title=context.keyword.title()),
+                                       context, formatted_context=formatted_context)
+        return title
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_title(self, context: SEOContext, *, formatted_context: Optional[str] = None) -> str:
+        """Generate a title, raising on failure so transient errors are retried"""
+        self.logger.info("Generating title for: %s", context.keyword)
         
-        formatted_context = self._format_context_for_prompt(context)
+        if formatted_context is None:
+            formatted_context = context.prompt_context
         
         prompt = f"""
         {formatted_context}
         
-        Generate an SEO-optimized blog post title that:
-        1. Includes the primary keyword naturally
-        2. Is compelling and click-worthy
-        3. Is {TITLE_OPTIMAL_LENGTH} characters or less
-        4. Matches the search intent
-        5. Stands out from competitors
-        
-        Consider the user goal and target audience.
-        Respond with ONLY the title, no explanations or quotes.
+        Generate the title.
         """
         
-        try:
-            response = self.model.generate_content(prompt)
-            title = response.text.strip().replace('"', '').replace("'", "")
-            
-            # Ensure title length
-            if len(title) > TITLE_OPTIMAL_LENGTH:
-                title = title[:TITLE_OPTIMAL_LENGTH].rsplit(' ', 1)[0]
-            
-            self.logger.info(f"Generated title: {title}")
-            return title
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate title: {e}")
-            return f"The Complete Guide to {context.keyword.title()}"
+        # Titles past the limit get trimmed anyway, so stop reading shortly after it
+        title = self._generate(prompt, "title", max_chars=int(TITLE_OPTIMAL_LENGTH * 1.2)).strip().translate(QUOTE_STRIP_TABLE)
+        
+        # Ensure title length
+        if len(title) > TITLE_OPTIMAL_LENGTH:
+            title = title[:TITLE_OPTIMAL_LENGTH].rsplit(' ', 1)[0]
+        
+        self.logger.info("Generated title: %s", title)
+        return title
     
-    @retry_with_backoff(max_retries=3)
-    def generate_meta_description(self, context: SEOContext, title: str) -> str:
+    def generate_meta_description(self, context: SEOContext, title: str, *, formatted_context: Optional[str] = None) -> str:
         """
         Generate SEO-optimized meta description
         
         Args:
             context: SEO context
             title: Article title
+            formatted_context: Pre-formatted context, reused across calls for the same context
             
         Returns:
-            Generated meta description
+            Generated meta description, or a template one if generation fails
         """
-        self.logger.info(f"Generating meta description for: {context.keyword}")
+        meta_desc, _ = self._with_fallback("meta description", self._generate_meta_description,
+                                           FALLBACK_META_DESCRIPTION.format(keyword=context.keyword),
+                                           context, title, formatted_context=formatted_context)
+        return meta_desc
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_meta_description(self, context: SEOContext, title: str, *, formatted_context: Optional[str] = None) -> str:
+        """Generate a meta description, raising on failure so transient errors are retried"""
+        self.logger.info("Generating meta description for: %s", context.keyword)
         
-        formatted_context = self._format_context_for_prompt(context)
+        if formatted_context is None:
+            formatted_context = context.prompt_context
         
         prompt = f"""
         {formatted_context}
         
         Title: {title}
         
-        Generate a meta description that:
-        1. Is 120-{META_DESCRIPTION_MAX_LENGTH} characters
-        2. Includes the primary keyword naturally
-        3. Is compelling and action-oriented
-        4. Summarizes the value proposition
-        5. Encourages clicks
-        
-        Respond with ONLY the meta description, no explanations.
+        Generate the meta description.
         """
         
-        try:
-            response = self.model.generate_content(prompt)
-            meta_desc = response.text.strip()
-            
-            # Ensure length constraints
-            if len(meta_desc) > META_DESCRIPTION_MAX_LENGTH:
-                meta_desc = meta_desc[:META_DESCRIPTION_MAX_LENGTH].rsplit(' ', 1)[0] + "..."
-            
-            self.logger.info(f"Generated meta description ({len(meta_desc)} chars)")
-            return meta_desc
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate meta description: {e}")
-            return f"Learn everything about {context.keyword} in this comprehensive guide. Expert tips, best practices, and actionable insights."
+        meta_desc = self._generate(prompt, "meta_description", max_chars=int(META_DESCRIPTION_MAX_LENGTH * 1.2)).strip()
+        
+        # Ensure length constraints
+        if len(meta_desc) > META_DESCRIPTION_MAX_LENGTH:
+            meta_desc = meta_desc[:META_DESCRIPTION_MAX_LENGTH].rsplit(' ', 1)[0] + "..."
+        
+        self.logger.info("Generated meta description (%d chars)", len(meta_desc))
+        return meta_desc
     
-    @retry_with_backoff(max_retries=3)
-    def generate_outline(self, context: SEOContext, title: str) -> List[str]:
+    def generate_outline(self, context: SEOContext, title: str, *, formatted_context: Optional[str] = None) -> List[str]:
         """
         Generate detailed content outline
         
         Args:
             context: SEO context
             title: Article title
+            formatted_context: Pre-formatted context, reused across calls for the same context
             
         Returns:
-            List of outline items
+            List of outline items, or a template outline if generation fails
         """
-        self.logger.info(f"Generating outline for: {context.keyword}")
+        outline, _ = self._with_fallback("outline", self._generate_outline, self._fallback_outline(context),
+                                         context, title, formatted_context=formatted_context)
+        return outline
+    
+    @staticmethod
+    def _fallback_outline(context: SEOContext) -> List[str]:
+        """Template outline used when outline generation fails"""
+        keyword_title = context.keyword.title()
+        return [item.format(keyword_title=keyword_title) for item in FALLBACK_OUTLINE]
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_outline(self, context: SEOContext, title: str, *, formatted_context: Optional[str] = None) -> List[str]:
+        """Generate an outline, raising on failure so transient errors are retried"""
+        self.logger.info("Generating outline for: %s", context.keyword)
         
-        formatted_context = self._format_context_for_prompt(context)
+        if formatted_context is None:
+            formatted_context = context.prompt_context
         
         prompt = f"""
         {formatted_context}
         
         Title: {title}
         
-        Create a detailed blog post outline with:
-        1. Introduction (hook, problem, preview)
-        2. 5-7 main sections (H2 level)
-        3. 2-3 subsections per main section (H3 level)
-        4. Conclusion with CTA
+        Create the outline.
+        """
         
-        Make it logical, comprehensive, and SEO-friendly.
-        Address the user questions and content opportunities.
+        outline_text = self._generate(prompt, "outline").strip()
         
-        Format as a numbered list with clear hierarchy.
-        Use "1.", "2." for main sections and "a.", "b." for subsections.
-        """
+        # Parse outline into list, stripping each line once and dropping blanks and markdown headings
+        cleaned_outline = [
+            line for line in map(str.strip, outline_text.splitlines())
+            if line and not line.startswith('#')
+        ]
         
-        try:
-            response = self.model.generate_content(prompt)
-            outline_text = response.text.strip()
-            
-            # Parse outline into list
-            outline_lines = [line.strip() for line in outline_text.split('\n') if line.strip()]
-            
-            # Clean up formatting
-            cleaned_outline = []
-            for line in outline_lines:
-                if line and not line.startswith('#'):
-                    cleaned_outline.append(line)
-            
-            self.logger.info(f"Generated outline with {len(cleaned_outline)} sections")
-            return cleaned_outline
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate outline: {e}")
-            return [
-                "1. Introduction",
-                "2. What is " + context.keyword.title(),
-                "3. Benefits and Importance",
-                "4. Best Practices",
-                "5. Common Mistakes to Avoid",
-                "6. Tools and Resources",
-                "7. Conclusion"
-            ]
+        self.logger.info("Generated outline with %d sections", len(cleaned_outline))
+        return cleaned_outline
     
-    @retry_with_backoff(max_retries=3)
-    def determine_word_count(self, context: SEOContext) -> int:
+    def determine_word_count(self, context: SEOContext, *, formatted_context: Optional[str] = None) -> int:
         """
         Determine optimal word count for content
         
         Args:
             context: SEO context
+            formatted_context: Pre-formatted context, reused across calls for the same context
             
         Returns:
-            Recommended word count
+            Recommended word count, or DEFAULT_WORD_COUNT_TARGET if generation fails
         """
-        self.logger.info(f"Determining word count for: {context.keyword}")
+        word_count, _ = self._with_fallback("word count", self._determine_word_count, DEFAULT_WORD_COUNT_TARGET,
+                                            context, formatted_context=formatted_context)
+        return word_count
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _determine_word_count(self, context: SEOContext, *, formatted_context: Optional[str] = None) -> int:
+        """Ask for the optimal word count, raising on failure so transient errors are retried"""
+        self.logger.info("Determining word count for: %s", context.keyword)
         
-        formatted_context = self._format_context_for_prompt(context)
+        if formatted_context is None:
+            formatted_context = context.prompt_context
         
         prompt = f"""
         {formatted_context}
         
-        Based on the search intent, topic complexity, and competitive landscape,
-        what would be the optimal word count for this content?
+        What would be the optimal word count for this content?
+        """
         
-        Consider:
-        - Search intent type (informational content typically needs more depth)
-        - Topic complexity and breadth
-        - User expectations
-        - Competitive requirements
+        word_count_text = self._generate(prompt, "word_count").strip()
         
-        Respond with just a number between {MIN_WORD_COUNT} and {MAX_WORD_COUNT}.
-        """
+        # Extract the first number from response
+        match = FIRST_NUMBER_RE.search(word_count_text)
+        if match:
+            word_count = int(match.group(0))
+            word_count = max(MIN_WORD_COUNT, min(MAX_WORD_COUNT, word_count))
+        else:
+            word_count = DEFAULT_WORD_COUNT_TARGET
         
-        try:
-            response = self.model.generate_content(prompt)
-            word_count_text = response.text.strip()
-            
-            # Extract number from response
-            import re
-            numbers = re.findall(r'\d+', word_count_text)
-            if numbers:
-                word_count = int(numbers[0])
-                word_count = max(MIN_WORD_COUNT, min(MAX_WORD_COUNT, word_count))
-            else:
-                word_count = DEFAULT_WORD_COUNT_TARGET
-            
-            self.logger.info(f"Determined word count: {word_count}")
-            return word_count
-            
-        except Exception as e:
-            self.logger.error(f"Failed to determine word count: {e}")
-            return DEFAULT_WORD_COUNT_TARGET
+        self.logger.info("Determined word count: %d", word_count)
+        return word_count
     
     def generate_internal_links(self, context: SEOContext) -> List[str]:
         """
@@ -370,19 +554,52 @@ class ContentGenerator:
         Returns:
             ContentBrief object
         """
-        self.logger.info(f"Generating content brief for: {context.keyword}")
+        self.logger.info("Generating content brief for: %s", context.keyword)
         
         start_time = time.time()
         
-        # Generate all components
-        title = self.generate_title(context)
-        meta_description = self.generate_meta_description(context, title)
-        outline = self.generate_outline(context, title)
-        word_count = self.determine_word_count(context)
+        # Every prompt starts with the same context block, memoized on the context
+        formatted_context = context.prompt_context
+        
+        # Word count is independent of the title, so it runs alongside it;
+        # meta description and outline only need the title and run together
+        word_count_future = self._executor.submit(
+            self._with_fallback, "word count", self._determine_word_count, DEFAULT_WORD_COUNT_TARGET,
+            context, formatted_context=formatted_context
+        )
+        try:
+            title, title_fallback = self._with_fallback(
+                "title", self._generate_title, FALLBACK_TITLE.format(keyword_title=context.keyword.title()),
+                context, formatted_context=formatted_context
+            )
+        except Exception:
+            word_count_future.cancel()
+            raise
+        meta_future = self._executor.submit(
+            self._with_fallback, "meta description", self._generate_meta_description,
+            FALLBACK_META_DESCRIPTION.format(keyword=context.keyword), context, title, formatted_context=formatted_context
+        )
+        outline_future = self._executor.submit(
+            self._with_fallback, "outline", self._generate_outline, self._fallback_outline(context),
+            context, title, formatted_context=formatted_context
+        )
+        
         internal_links = self.generate_internal_links(context)
         cta_suggestions = self.generate_cta_suggestions(context)
         optimization_tips = self.generate_optimization_tips(context)
         
+        (meta_description, meta_fallback), (outline, outline_fallback), (word_count, word_count_fallback) = \
+            self._wait_all([meta_future, outline_future, word_count_future])
+        
+        # Record which fields are template text, so degraded briefs are not cached
+        fallback_flags = (
+            ("title", title_fallback),
+            ("meta_description", meta_fallback),
+            ("outline", outline_fallback),
+            ("word_count_target", word_count_fallback)
+        )
+        fallback_fields = [name for name, used in fallback_flags if used]
+        
         # Create content brief
         brief = ContentBrief(
             keyword=context.keyword,
@@ -393,15 +610,53 @@ class ContentGenerator:
             internal_links=internal_links,
             cta_suggestions=cta_suggestions,
             optimization_tips=optimization_tips,
-            content_type=ContentType.BLOG_POST
+            content_type=ContentType.BLOG_POST,
+            fallback_fields=fallback_fields
         )
         
         generation_time = time.time() - start_time
-        self.logger.info(f"Content brief generated in {generation_time:.2f} seconds")
+        self.logger.info("Content brief generated in %.2f seconds", generation_time)
         
         return brief
     
-    @retry_with_backoff(max_retries=3)
+    def generate_briefs(self, contexts: List[SEOContext], max_workers: Optional[int] = None) -> List[ContentBrief]:
+        """
+        Generate content briefs for many contexts concurrently
+        
+        Briefs run on their own worker threads (a brief waits on the fan-out
+        pool, so it must not occupy it). Gemini calls across all briefs stay
+        bounded by max_in_flight.
+        
+        Args:
+            contexts: SEO contexts to generate briefs for
+            max_workers: Briefs in progress at once (defaults to max_in_flight)
+            
+        Returns:
+            ContentBrief objects in the same order as contexts
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_in_flight, thread_name_prefix="brief") as executor:
+            return list(executor.map(self.generate_content_brief, contexts))
+    
+    async def agenerate_briefs(self, contexts: List[SEOContext],
+                               max_concurrency: Optional[int] = None) -> List[ContentBrief]:
+        """
+        Generate content briefs for many contexts without blocking the event loop
+        
+        Args:
+            contexts: SEO contexts to generate briefs for
+            max_concurrency: Briefs in progress at once (defaults to max_in_flight)
+            
+        Returns:
+            ContentBrief objects in the same order as contexts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_in_flight)
+        
+        async def generate(context: SEOContext) -> ContentBrief:
+            async with semaphore:
+                return await asyncio.to_thread(self.generate_content_brief, context)
+        
+        return await asyncio.gather(*(generate(context) for context in contexts))
+    
     def generate_section_content(self, section_title: str, keyword: str, article_title: str, target_words: int = 300) -> str:
         """
         Generate content for a specific section
@@ -413,9 +668,19 @@ class ContentGenerator:
             target_words: Target word count for section
             
         Returns:
-            Generated section content
+            Generated section content, or placeholder text if generation fails
         """
-        self.logger.info(f"Generating section: {section_title}")
+        content, _ = self._with_fallback(
+            "section content", self._generate_section_content,
+            FALLBACK_SECTION.format(section_title=section_title, keyword=keyword, section_title_lower=section_title.lower()),
+            section_title, keyword, article_title, target_words
+        )
+        return content
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_section_content(self, section_title: str, keyword: str, article_title: str, target_words: int = 300) -> str:
+        """Generate one section, raising on failure so transient errors are retried"""
+        self.logger.info("Generating section: %s", section_title)
         
         prompt = f"""
         Write a detailed section for an article titled "{article_title}".
@@ -423,28 +688,122 @@ class ContentGenerator:
         Section Title: {section_title}
         Target Keyword: {keyword}
         Target Length: {target_words} words
+        """
         
-        Requirements:
-        1. Provide actionable, valuable information
-        2. Include the target keyword naturally (don't over-optimize)
-        3. Use clear, engaging language
-        4. Include specific examples where relevant
-        5. Break up text with bullet points or numbered lists when appropriate
-        6. Make it scannable and readable
+        content = self._generate(prompt, "section").strip()
         
-        Write ONLY the section content, no title or heading.
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Generated section content (%d words)", content.count(' ') + 1)
+        return content
+    
+    def generate_all_sections(self, section_titles: List[str], keyword: str, article_title: str,
+                              target_words: int = 300) -> List[ContentSection]:
+        """
+        Generate content for all sections in a single JSON-mode call
+        
+        Args:
+            section_titles: Titles of the sections, in order
+            keyword: Target keyword
+            article_title: Main article title
+            target_words: Target word count per section
+            
+        Returns:
+            List of ContentSection objects in section_titles order
+            
+        Raises:
+            ValueError: If no response after retries is a JSON array with one object per section
         """
+        return self._generate_all_sections(section_titles, keyword, article_title, target_words)
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_all_sections(self, section_titles: List[str], keyword: str, article_title: str,
+                               target_words: int) -> List[ContentSection]:
+        """Generate and parse all sections, raising on failure so transient errors and malformed replies are retried"""
+        self.logger.info("Generating %d sections for: %s", len(section_titles), article_title)
+        
+        titles = "\n".join(f"{i}. {title}" for i, title in enumerate(section_titles, 1))
+        prompt = f"""
+        Write the sections for an article titled "{article_title}".
+        
+        Target Keyword: {keyword}
+        Target Length: {target_words} words per section
+        
+        Section Titles:
+        {titles}
+        """
+        
+        return self._generate(prompt, "sections", json_output=True,
+                              parse=lambda text: self._parse_sections(text, section_titles))
+    
+    @staticmethod
+    def _parse_sections(text: str, section_titles: List[str]) -> List[ContentSection]:
+        """
+        Parse a JSON-mode sections reply
+        
+        Raises:
+            ValueError: If the text is not a JSON array with one object per section
+        """
+        sections = json.loads(text)
+        if not isinstance(sections, list) or len(sections) != len(section_titles):
+            raise ValueError(f"Expected a JSON array of {len(section_titles)} sections")
         
         try:
-            response = self.model.generate_content(prompt)
-            content = response.text.strip()
+            return [
+                ContentSection(heading=section_title, content=str(section["content"]).strip())
+                for section_title, section in zip(section_titles, sections)
+            ]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed section object: {e}")
+    
+    def generate_introduction(self, context: SEOContext, content_brief: ContentBrief) -> str:
+        """
+        Generate article introduction
+        
+        Args:
+            context: SEO context
+            content_brief: Content brief the article follows
             
-            self.logger.info(f"Generated section content ({len(content.split())} words)")
-            return content
+        Returns:
+            Introduction text, or a template introduction if generation fails
+        """
+        introduction, _ = self._with_fallback("introduction", self._generate_introduction,
+                                              FALLBACK_INTRODUCTION.format(keyword=context.keyword), context, content_brief)
+        return introduction
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_introduction(self, context: SEOContext, content_brief: ContentBrief) -> str:
+        """Generate an introduction, raising on failure so transient errors are retried"""
+        intro_prompt = f"""
+        Write an engaging introduction for an article titled "{content_brief.title}" about "{context.keyword}".
+        
+        Search intent: {context.search_intent}
+        """
+        
+        return self._generate(intro_prompt, "introduction").strip()
+    
+    def generate_conclusion(self, context: SEOContext, content_brief: ContentBrief) -> str:
+        """
+        Generate article conclusion
+        
+        Args:
+            context: SEO context
+            content_brief: Content brief the article follows
             
-        except Exception as e:
-            self.logger.error(f"Failed to generate section content: {e}")
-            return f"Content for {section_title} section would be generated here. This section would cover key aspects of {keyword} related to {section_title.lower()}."
+        Returns:
+            Conclusion text, or a template conclusion if generation fails
+        """
+        conclusion, _ = self._with_fallback("conclusion", self._generate_conclusion,
+                                            FALLBACK_CONCLUSION.format(keyword=context.keyword), context, content_brief)
+        return conclusion
+    
+    @retry_with_backoff(max_retries=3, giveup=PERMANENT_GENERATION_ERRORS)
+    def _generate_conclusion(self, context: SEOContext, content_brief: ContentBrief) -> str:
+        """Generate a conclusion, raising on failure so transient errors are retried"""
+        conclusion_prompt = f"""
+        Write a compelling conclusion for an article titled "{content_brief.title}" about "{context.keyword}".
+        """
+        
+        return self._generate(conclusion_prompt, "conclusion").strip()
     
     def generate_full_article(self, context: SEOContext, content_brief: Optional[ContentBrief] = None) -> FullArticle:
         """
@@ -457,7 +816,7 @@ class ContentGenerator:
         Returns:
             FullArticle object
         """
-        self.logger.info(f"Generating full article for: {context.keyword}")
+        self.logger.info("Generating full article for: %s", context.keyword)
         
         start_time = time.time()
         
@@ -465,61 +824,56 @@ class ContentGenerator:
         if not content_brief:
             content_brief = self.generate_content_brief(context)
         
-        # Generate introduction
-        intro_prompt = f"""
-        Write an engaging introduction for an article titled "{content_brief.title}" about "{context.keyword}".
+        # Introduction, conclusion and sections only depend on the brief, so
+        # they are all generated in parallel (limited to 6 sections for performance)
+        section_titles = content_brief.outline[:6]
+        target_section_words = content_brief.word_count_target // min(len(content_brief.outline), 6)
         
-        Requirements:
-        - 150-200 words
-        - Hook the reader immediately  
-        - Include the target keyword in the first sentence
-        - Preview what the article will cover
-        - Set clear expectations
-        - Address the user's search intent: {context.search_intent}
-        """
+        futures = [
+            self._executor.submit(self._with_fallback, "introduction", self._generate_introduction,
+                                  FALLBACK_INTRODUCTION.format(keyword=context.keyword), context, content_brief),
+            self._executor.submit(self._with_fallback, "conclusion", self._generate_conclusion,
+                                  FALLBACK_CONCLUSION.format(keyword=context.keyword), context, content_brief)
+        ]
         
+        # One JSON-mode call covers every section; fall back to a call per section
         try:
-            intro_response = self.model.generate_content(intro_prompt)
-            introduction = intro_response.text.strip()
+            sections = self.generate_all_sections(section_titles, context.keyword, content_brief.title, target_section_words)
+        except PERMANENT_GENERATION_ERRORS:
+            for future in futures:
+                future.cancel()
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to generate introduction: {e}")
-            introduction = f"In this comprehensive guide, we'll explore everything you need to know about {context.keyword}. Whether you're a beginner or looking to advance your knowledge, this article will provide valuable insights and practical tips."
-        
-        # Generate sections (limit to first 6 for performance)
-        sections = []
-        target_section_words = content_brief.word_count_target // min(len(content_brief.outline), 6)
-        
-        for section_title in content_brief.outline[:6]:
-            content = self.generate_section_content(
-                section_title, 
-                context.keyword, 
-                content_brief.title,
-                target_section_words
+            self.logger.warning("Batched section generation failed, generating sections individually: %s", e)
+            sections = None
+            futures.extend(
+                self._executor.submit(
+                    self._with_fallback,
+                    "section content",
+                    self._generate_section_content,
+                    FALLBACK_SECTION.format(section_title=section_title, keyword=context.keyword,
+                                            section_title_lower=section_title.lower()),
+                    section_title,
+                    context.keyword,
+                    content_brief.title,
+                    target_section_words
+                )
+                for section_title in section_titles
             )
-            
-            sections.append(ContentSection(
-                heading=section_title,
-                content=content
-            ))
-        
-        # Generate conclusion
-        conclusion_prompt = f"""
-        Write a compelling conclusion for an article titled "{content_brief.title}" about "{context.keyword}".
-        
-        Requirements:
-        - 150-200 words
-        - Summarize key takeaways
-        - Include a clear call-to-action
-        - Reinforce the value provided
-        - End with actionable next steps for the reader
-        """
         
-        try:
-            conclusion_response = self.model.generate_content(conclusion_prompt)
-            conclusion = conclusion_response.text.strip()
-        except Exception as e:
-            self.logger.error(f"Failed to generate conclusion: {e}")
-            conclusion = f"Understanding {context.keyword} is essential for success in today's digital landscape. By implementing the strategies and best practices outlined in this guide, you'll be well-equipped to achieve your goals. Start applying these insights today and see the difference they can make."
+        (introduction, intro_fallback), (conclusion, conclusion_fallback), *section_results = self._wait_all(futures)
+        fallback_fields = [
+            name for name, used in (("introduction", intro_fallback), ("conclusion", conclusion_fallback)) if used
+        ]
+        if sections is None:
+            sections = [
+                ContentSection(heading=section_title, content=content)
+                for section_title, (content, _) in zip(section_titles, section_results)
+            ]
+            fallback_fields.extend(
+                f"section:{section_title}"
+                for section_title, (_, used) in zip(section_titles, section_results) if used
+            )
         
         # Create full article
         article = FullArticle(
@@ -529,10 +883,11 @@ class ContentGenerator:
             introduction=introduction,
             sections=sections,
             conclusion=conclusion,
-            content_brief=content_brief
+            content_brief=content_brief,
+            fallback_fields=fallback_fields
         )
         
         generation_time = time.time() - start_time
-        self.logger.info(f"Full article generated in {generation_time:.2f} seconds ({article.total_word_count} words)")
+        self.logger.info("Full article generated in %.2f seconds (%d words)", generation_time, article.total_word_count)
         
         return article
@@ -3,38 +3,184 @@ Data Retrieval Component for SEO Assistant Pipeline
 Handles fetching data from various sources (Wikipedia, search APIs, etc.)
 """
 
+import re
 import time
+import heapq
 import logging
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote_plus
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..entity import SEOContext, WikipediaResult, SearchIntent
-from ..utils import retry_with_backoff, calculate_text_similarity, clean_text, extract_keywords_from_text
-from ..constants import WIKIPEDIA_RESULTS_LIMIT, DEFAULT_TIMEOUT, MAX_RETRIES
+from ..utils import retry_with_backoff, calculate_similarity_batch, clean_text, extract_keywords_from_text
+from ..constants import (
+    WIKIPEDIA_RESULTS_LIMIT, DEFAULT_TIMEOUT, MAX_RETRIES, MAX_CONCURRENCY,
+    HTTP_USER_AGENT, WIKIPEDIA_API_URL, CONTEXT_CACHE_TTL, MAX_CACHE_SIZE,
+    WIKIPEDIA_VALIDATOR_CACHE_SIZE
+)
+
+
+def _compile_words(words: Tuple[str, ...]) -> "re.Pattern":
+    """Compile indicator words into a single alternation for one-pass matching"""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Characters Wikipedia leaves unescaped in article URLs
+WIKIPEDIA_TITLE_SAFE_CHARS = "_()',:/!*"
+
+# Search intent indicators in priority order, each matched anywhere in the keyword
+SEARCH_INTENT_RULES = (
+    (_compile_words(('buy', 'purchase', 'order', 'price', 'cost', 'cheap', 'discount', 'deal')),
+     SearchIntent.TRANSACTIONAL, "User appears to be ready to make a purchase or transaction"),
+    (_compile_words(('best', 'top', 'review', 'compare', 'vs', 'alternative', 'recommendation')),
+     SearchIntent.COMMERCIAL, "User is researching options before making a decision"),
+    (_compile_words(('login', 'sign in', 'website', 'official')),
+     SearchIntent.NAVIGATIONAL, "User is looking for a specific website or page"),
+    (_compile_words(('how to', 'tutorial', 'guide', 'learn', 'step by step')),
+     SearchIntent.INFORMATIONAL, "User wants to learn how to do something"),
+)
+
+# Question indicators, matched only at the start of the keyword
+QUESTION_PREFIXES = ('what', 'why', 'when', 'where', 'who', 'which', 'how')
+
+# Common words never suggested as related keywords
+STOP_WORDS = frozenset({
+    'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'their',
+    'said', 'each', 'which', 'what', 'where', 'when', 'more', 'very', 'some',
+    'could', 'other', 'after', 'first', 'well', 'many', 'most', 'also'
+})
+
+
+# Content opportunity templates, formatted with the title-cased keyword
+OPPORTUNITY_TEMPLATES = (
+    "The Complete Guide to {keyword}",
+    "{keyword} for Beginners: Everything You Need to Know",
+    "Best {keyword} Practices in 2025",
+    "{keyword} vs Alternatives: Comprehensive Comparison",
+    "Common {keyword} Mistakes and How to Avoid Them",
+)
+WIKIPEDIA_OPPORTUNITY_TEMPLATES = (
+    "How {title} Relates to {keyword}",
+    "Understanding {title}: A {keyword} Perspective",
+    "The Role of {title} in Modern {keyword}",
+)
+
+# User question templates, formatted with the keyword as given
+QUESTION_TEMPLATES = (
+    "What is {keyword}?",
+    "How does {keyword} work?",
+    "Why is {keyword} important?",
+    "What are the benefits of {keyword}?",
+    "How to get started with {keyword}?",
+    "What are common {keyword} mistakes?",
+    "Best {keyword} tools and resources?",
+    "How to improve your {keyword} skills?",
+)
+WIKIPEDIA_QUESTION_TEMPLATES = (
+    "How is {title} related to {keyword}?",
+    "What role does {title} play in {keyword}?",
+    "Should I learn about {title} for {keyword}?",
+)
+
+
+def _unique(items: Iterable[str]) -> Iterator[str]:
+    """Yield items in order, skipping repeats"""
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def _fill_templates(keyword: str, wikipedia_results: List[WikipediaResult], base_templates: Tuple[str, ...],
+                    wikipedia_templates: Tuple[str, ...], limit: int) -> List[str]:
+    """Format base then per-result templates lazily, stopping at limit distinct items"""
+    candidates = chain(
+        (template.format(keyword=keyword) for template in base_templates),
+        (template.format(keyword=keyword, title=result.title)
+         for result in wikipedia_results for template in wikipedia_templates)
+    )
+    return list(islice(_unique(candidates), limit))
 
 
 class DataRetriever:
     """Handles data retrieval from various sources for SEO content generation"""
     
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES):
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES,
+                 pool_size: int = MAX_CONCURRENCY, session: Optional["requests.Session"] = None,
+                 cache_size: int = MAX_CACHE_SIZE):
         """
         Initialize data retriever
         
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            pool_size: Number of pooled keep-alive connections per host
+            session: Optional pre-configured requests session to reuse
+            cache_size: Contexts memoized per (keyword, user_goal) for CONTEXT_CACHE_TTL (0 disables)
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_size = pool_size
         self.logger = logging.getLogger(__name__)
         
+        self._cached_context = lru_cache(maxsize=cache_size)(self._context_for_bucket) if cache_size > 0 else None
+        
+        # (keyword, limit) -> (response validators, parsed results) for conditional requests
+        self._validator_cache: "OrderedDict[Tuple[str, int], Tuple[Dict[str, str], List[WikipediaResult]]]" = OrderedDict()
+        self._validator_lock = threading.Lock()
+        
         if not requests:
             self.logger.warning("Requests library not available, some features may be limited")
+            self.session = None
+        else:
+            self.session = session or self._create_session(pool_size)
+    
+    def _create_session(self, pool_size: int) -> "requests.Session":
+        """Create a long-lived session so connections are kept alive across requests"""
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        
+        session = requests.Session()
+        session.headers.update({"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip"})
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        if self.session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     @retry_with_backoff(max_retries=3)
     def fetch_wikipedia_data(self, keyword: str, limit: int = WIKIPEDIA_RESULTS_LIMIT) -> List[WikipediaResult]:
@@ -52,55 +198,158 @@ class DataRetriever:
             self.logger.error("Cannot fetch Wikipedia data: requests library not available")
             return []
         
-        self.logger.info(f"Fetching Wikipedia data for: {keyword}")
+        self.logger.info("Fetching Wikipedia data for: %s", keyword)
         
         try:
-            # Use Wikipedia search API
-            search_url = "https://en.wikipedia.org/w/api.php"
-            search_params = {
-                "action": "query",
-                "format": "json",
-                "list": "search",
-                "srsearch": keyword,
-                "srlimit": limit,
-                "srprop": "snippet|titlesnippet"
-            }
-            
-            response = requests.get(search_url, params=search_params, timeout=self.timeout)
-            response.raise_for_status()
+            # Use Wikipedia search API, revalidating any previous response
+            cache_key = (keyword, limit)
+            params = self._wikipedia_search_params(keyword, limit)
             
-            data = response.json()
-            results = []
+            data, headers = self._search(params, self._conditional_headers(cache_key))
+            if data is None:
+                results = self._revalidated_results(cache_key)
+                if results is not None:
+                    return results
+                # Entry was evicted meanwhile; fetch unconditionally
+                data, headers = self._search(params)
             
-            for page in data.get("query", {}).get("search", []):
-                title = page.get("title", "")
-                snippet = clean_text(page.get("snippet", ""))
-                
-                # Remove search highlight tags
-                snippet = snippet.replace("<span class=\"searchmatch\">", "").replace("</span>", "")
-                
-                url = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
-                
-                # Calculate relevance score
-                relevance_score = self._calculate_relevance_score(keyword, title, snippet)
-                
-                results.append(WikipediaResult(
-                    title=title,
-                    snippet=snippet,
-                    url=url,
-                    relevance_score=relevance_score
-                ))
+            results = self._parse_wikipedia_results(keyword, data)
+            self._store_validators(cache_key, headers, results)
             
-            # Sort by relevance score
-            results.sort(key=lambda x: x.relevance_score, reverse=True)
-            
-            self.logger.info(f"Retrieved {len(results)} Wikipedia results")
+            self.logger.info("Retrieved %d Wikipedia results", len(results))
             return results
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch Wikipedia data: {e}")
+            self.logger.error("Failed to fetch Wikipedia data: %s", e)
             return []
     
+    def _search(self, params: Dict, headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[Dict], Dict]:
+        """
+        Run a Wikipedia search request
+        
+        Returns:
+            Tuple of (decoded JSON, or None on 304 Not Modified, response headers)
+        """
+        response = self.session.get(WIKIPEDIA_API_URL, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return None, response.headers
+        
+        response.raise_for_status()
+        data = orjson.loads(response.content) if orjson else response.json()
+        return data, response.headers
+    
+    def _conditional_headers(self, cache_key: Tuple[str, int]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a previously fetched search"""
+        with self._validator_lock:
+            cached = self._validator_cache.get(cache_key)
+        
+        if not cached:
+            return {}
+        
+        validators = cached[0]
+        headers = {}
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        return headers
+    
+    def _revalidated_results(self, cache_key: Tuple[str, int]) -> Optional[List[WikipediaResult]]:
+        """Results stored for a search the server reported as unchanged (304)"""
+        with self._validator_lock:
+            cached = self._validator_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._validator_cache.move_to_end(cache_key)
+        
+        self.logger.debug("Wikipedia results unchanged for: %s", cache_key[0])
+        return list(cached[1])
+    
+    def _store_validators(self, cache_key: Tuple[str, int], response_headers, results: List[WikipediaResult]):
+        """Remember a response's ETag/Last-Modified with its results for later revalidation"""
+        validators = {name: response_headers[name] for name in ("ETag", "Last-Modified") if name in response_headers}
+        
+        with self._validator_lock:
+            if not validators:
+                self._validator_cache.pop(cache_key, None)
+                return
+            
+            self._validator_cache[cache_key] = (validators, list(results))
+            self._validator_cache.move_to_end(cache_key)
+            while len(self._validator_cache) > WIKIPEDIA_VALIDATOR_CACHE_SIZE:
+                self._validator_cache.popitem(last=False)
+    
+    def _wikipedia_search_params(self, keyword: str, limit: int) -> Dict[str, object]:
+        """Query parameters for a Wikipedia full-text search"""
+        return {
+            "action": "query",
+            "format": "json",
+            "list": "search",
+            "srsearch": keyword,
+            "srlimit": limit,
+            "srprop": "snippet",  # Only the snippet is used; titles are always returned
+            "srinfo": ""  # Skip totalhits/suggestion metadata
+        }
+    
+    def _parse_wikipedia_results(self, keyword: str, data: Dict) -> List[WikipediaResult]:
+        """
+        Build scored WikipediaResult objects from a search API response
+        
+        Args:
+            keyword: Search keyword
+            data: Decoded JSON response
+            
+        Returns:
+            Results sorted by relevance score
+        """
+        pages = data.get("query", {}).get("search", [])
+        titles = [page.get("title", "") for page in pages]
+        
+        # clean_text strips all tags, including the search highlight spans
+        snippets = [clean_text(page.get("snippet", "")) for page in pages]
+        
+        # Score all results in one pass
+        relevance_scores = self._calculate_relevance_scores(keyword, titles, snippets)
+        
+        results = [
+            WikipediaResult(
+                title=title,
+                snippet=snippet,
+                url=f"https://en.wikipedia.org/wiki/{quote(title.replace(' ', '_'), safe=WIKIPEDIA_TITLE_SAFE_CHARS)}",
+                relevance_score=relevance_score
+            )
+            for title, snippet, relevance_score in zip(titles, snippets, relevance_scores)
+        ]
+        
+        # Sort by relevance score
+        results.sort(key=lambda x: x.relevance_score, reverse=True)
+        
+        return results
+    
+    def fetch_wikipedia_data_bulk(self, keywords: List[str], limit: int = WIKIPEDIA_RESULTS_LIMIT) -> Dict[str, List[WikipediaResult]]:
+        """
+        Fetch Wikipedia articles for many keywords at once
+        
+        MediaWiki full-text search takes a single query per request, so searches
+        are overlapped on the pooled session instead of run back to back.
+        
+        Args:
+            keywords: Search keywords (duplicates are fetched once)
+            limit: Maximum number of results per keyword
+            
+        Returns:
+            Mapping of keyword to its WikipediaResult list
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        if not unique_keywords:
+            return {}
+        
+        self.logger.info("Fetching Wikipedia data for %d keywords", len(unique_keywords))
+        
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(unique_keywords))) as executor:
+            results = executor.map(lambda keyword: self.fetch_wikipedia_data(keyword, limit), unique_keywords)
+            return dict(zip(unique_keywords, results))
+    
     def _calculate_relevance_score(self, keyword: str, title: str, snippet: str) -> float:
         """
         Calculate relevance score for Wikipedia result
@@ -113,22 +362,43 @@ class DataRetriever:
         Returns:
             Relevance score (0.0 to 1.0)
         """
-        score = 0.0
+        return self._calculate_relevance_scores(keyword, [title], [snippet])[0]
+    
+    def _calculate_relevance_scores(self, keyword: str, titles: List[str], snippets: List[str]) -> List[float]:
+        """
+        Calculate relevance scores for a list of Wikipedia results
+        
+        The keyword is lowercased and tokenized once and shared across results.
+        
+        Args:
+            keyword: Search keyword
+            titles: Article titles
+            snippets: Article snippets, aligned with titles
+            
+        Returns:
+            Relevance scores (0.0 to 1.0), aligned with titles
+        """
         keyword_lower = keyword.lower()
+        titles_lower = [t.lower() for t in titles]
+        snippets_lower = [s.lower() for s in snippets]
         
-        # Title relevance (weighted heavily)
-        title_similarity = calculate_text_similarity(keyword_lower, title.lower())
-        score += title_similarity * 0.6
+        # Title relevance (weighted heavily) and snippet relevance
+        title_similarities = calculate_similarity_batch(keyword_lower, titles_lower)
+        snippet_similarities = calculate_similarity_batch(keyword_lower, snippets_lower)
         
-        # Snippet relevance
-        snippet_similarity = calculate_text_similarity(keyword_lower, snippet.lower())
-        score += snippet_similarity * 0.3
+        scores = []
         
-        # Exact keyword matches
-        exact_matches = title.lower().count(keyword_lower) + snippet.lower().count(keyword_lower)
-        score += min(exact_matches * 0.1, 0.1)  # Cap at 0.1
+        for title_lower, snippet_lower, title_similarity, snippet_similarity in zip(
+                titles_lower, snippets_lower, title_similarities, snippet_similarities):
+            score = title_similarity * 0.6 + snippet_similarity * 0.3
+            
+            # Exact keyword matches
+            exact_matches = title_lower.count(keyword_lower) + snippet_lower.count(keyword_lower)
+            score += min(exact_matches * 0.1, 0.1)  # Cap at 0.1
+            
+            scores.append(min(score, 1.0))
         
-        return min(score, 1.0)
+        return scores
     
     def extract_related_keywords(self, keyword: str, wikipedia_results: List[WikipediaResult], limit: int = 10) -> List[str]:
         """
@@ -142,7 +412,7 @@ class DataRetriever:
         Returns:
             List of related keywords
         """
-        self.logger.info(f"Extracting related keywords for: {keyword}")
+        self.logger.info("Extracting related keywords for: %s", keyword)
         
         all_text = f"{keyword} "
         
@@ -154,27 +424,24 @@ class DataRetriever:
         potential_keywords = extract_keywords_from_text(all_text, min_length=4)
         
         # Filter out the original keyword and common stop words
-        stop_words = {
-            'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'their',
-            'said', 'each', 'which', 'what', 'where', 'when', 'more', 'very', 'some',
-            'could', 'other', 'after', 'first', 'well', 'many', 'most', 'also'
-        }
-        
         keyword_lower = keyword.lower()
+        text_lower = all_text.lower()
+        seen = set()
         related_keywords = []
+        mentions = {}
         
         for kw in potential_keywords:
             kw_lower = kw.lower()
             if (kw_lower != keyword_lower and 
-                kw_lower not in stop_words and 
+                kw_lower not in STOP_WORDS and 
                 len(kw) > 3 and
-                kw not in related_keywords):
+                kw_lower not in seen):
+                seen.add(kw_lower)
                 related_keywords.append(kw)
+                mentions[kw] = text_lower.count(kw_lower)
         
-        # Sort by length and relevance (longer keywords first)
-        related_keywords.sort(key=lambda x: (len(x), -all_text.lower().count(x.lower())), reverse=True)
-        
-        return related_keywords[:limit]
+        # Top keywords by length and relevance (longer keywords first)
+        return heapq.nlargest(limit, related_keywords, key=lambda x: (len(x), -mentions[x]))
     
     def generate_content_opportunities(self, keyword: str, wikipedia_results: List[WikipediaResult], limit: int = 8) -> List[str]:
         """
@@ -188,39 +455,11 @@ class DataRetriever:
         Returns:
             List of content opportunity suggestions
         """
-        self.logger.info(f"Generating content opportunities for: {keyword}")
-        
-        opportunities = []
-        
-        # Base content types
-        base_opportunities = [
-            f"The Complete Guide to {keyword.title()}",
-            f"{keyword.title()} for Beginners: Everything You Need to Know",
-            f"Best {keyword.title()} Practices in 2025",
-            f"{keyword.title()} vs Alternatives: Comprehensive Comparison",
-            f"Common {keyword.title()} Mistakes and How to Avoid Them"
-        ]
+        self.logger.info("Generating content opportunities for: %s", keyword)
         
-        opportunities.extend(base_opportunities)
-        
-        # Wikipedia-based opportunities
-        for result in wikipedia_results[:3]:  # Use top 3 results
-            title = result.title
-            opportunities.extend([
-                f"How {title} Relates to {keyword.title()}",
-                f"Understanding {title}: A {keyword.title()} Perspective",
-                f"The Role of {title} in Modern {keyword.title()}"
-            ])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_opportunities = []
-        for opp in opportunities:
-            if opp not in seen:
-                seen.add(opp)
-                unique_opportunities.append(opp)
-        
-        return unique_opportunities[:limit]
+        # Base content types, then Wikipedia-based opportunities from the top 3 results
+        return _fill_templates(keyword.title(), wikipedia_results[:3], OPPORTUNITY_TEMPLATES,
+                               WIKIPEDIA_OPPORTUNITY_TEMPLATES, limit)
     
     def extract_user_questions(self, keyword: str, wikipedia_results: List[WikipediaResult], limit: int = 8) -> List[str]:
         """
@@ -234,42 +473,11 @@ class DataRetriever:
         Returns:
             List of user questions
         """
-        self.logger.info(f"Extracting user questions for: {keyword}")
-        
-        questions = []
-        
-        # Base question templates
-        base_questions = [
-            f"What is {keyword}?",
-            f"How does {keyword} work?",
-            f"Why is {keyword} important?",
-            f"What are the benefits of {keyword}?",
-            f"How to get started with {keyword}?",
-            f"What are common {keyword} mistakes?",
-            f"Best {keyword} tools and resources?",
-            f"How to improve your {keyword} skills?"
-        ]
-        
-        questions.extend(base_questions)
-        
-        # Generate questions based on Wikipedia content
-        for result in wikipedia_results[:2]:
-            title = result.title
-            questions.extend([
-                f"How is {title} related to {keyword}?",
-                f"What role does {title} play in {keyword}?",
-                f"Should I learn about {title} for {keyword}?"
-            ])
+        self.logger.info("Extracting user questions for: %s", keyword)
         
-        # Remove duplicates
-        seen = set()
-        unique_questions = []
-        for q in questions:
-            if q not in seen:
-                seen.add(q)
-                unique_questions.append(q)
-        
-        return unique_questions[:limit]
+        # Base question templates, then questions based on the top 2 Wikipedia results
+        return _fill_templates(keyword, wikipedia_results[:2], QUESTION_TEMPLATES,
+                               WIKIPEDIA_QUESTION_TEMPLATES, limit)
     
     def analyze_search_intent(self, keyword: str, context: str = "") -> Tuple[SearchIntent, str]:
         """
@@ -282,54 +490,55 @@ class DataRetriever:
         Returns:
             Tuple of (SearchIntent enum, explanation string)
         """
-        self.logger.info(f"Analyzing search intent for: {keyword}")
+        self.logger.info("Analyzing search intent for: %s", keyword)
         
         keyword_lower = keyword.lower()
         
-        # Transactional indicators
-        transactional_words = ['buy', 'purchase', 'order', 'price', 'cost', 'cheap', 'discount', 'deal']
-        if any(word in keyword_lower for word in transactional_words):
-            return SearchIntent.TRANSACTIONAL, "User appears to be ready to make a purchase or transaction"
-        
-        # Commercial investigation indicators
-        commercial_words = ['best', 'top', 'review', 'compare', 'vs', 'alternative', 'recommendation']
-        if any(word in keyword_lower for word in commercial_words):
-            return SearchIntent.COMMERCIAL, "User is researching options before making a decision"
+        for pattern, intent, explanation in SEARCH_INTENT_RULES:
+            if pattern.search(keyword_lower):
+                return intent, explanation
         
-        # Navigational indicators
-        if any(word in keyword_lower for word in ['login', 'sign in', 'website', 'official']):
-            return SearchIntent.NAVIGATIONAL, "User is looking for a specific website or page"
-        
-        # How-to and tutorial indicators
-        how_to_words = ['how to', 'tutorial', 'guide', 'learn', 'step by step']
-        if any(word in keyword_lower for word in how_to_words):
-            return SearchIntent.INFORMATIONAL, "User wants to learn how to do something"
-        
-        # Question indicators
-        question_words = ['what', 'why', 'when', 'where', 'who', 'which', 'how']
-        if any(keyword_lower.startswith(word) for word in question_words):
+        if keyword_lower.startswith(QUESTION_PREFIXES):
             return SearchIntent.INFORMATIONAL, "User is seeking information or answers"
         
         # Default to informational
         return SearchIntent.INFORMATIONAL, "General information seeking intent"
     
-    def get_comprehensive_context(self, keyword: str, user_goal: str = "") -> SEOContext:
+    def get_comprehensive_context(self, keyword: str, user_goal: str = "",
+                                  wikipedia_results: Optional[List[WikipediaResult]] = None) -> SEOContext:
         """
         Get comprehensive context for a keyword
         
+        Repeat lookups within the same CONTEXT_CACHE_TTL window are served from
+        memory unless prefetched Wikipedia results are supplied.
+        
         Args:
             keyword: Primary keyword
             user_goal: User's goal or additional context
+            wikipedia_results: Prefetched Wikipedia results (fetched if omitted)
             
         Returns:
             SEOContext object with all retrieved data
         """
-        self.logger.info(f"Building comprehensive context for: {keyword}")
+        if wikipedia_results is None and self._cached_context:
+            return self._cached_context(keyword, user_goal, int(time.time() // CONTEXT_CACHE_TTL))
+        
+        return self._build_context(keyword, user_goal, wikipedia_results)
+    
+    def _context_for_bucket(self, keyword: str, user_goal: str, ts_bucket: int) -> SEOContext:
+        """Build a context; ts_bucket only varies the memoization key so entries expire"""
+        return self._build_context(keyword, user_goal)
+    
+    def _build_context(self, keyword: str, user_goal: str = "",
+                       wikipedia_results: Optional[List[WikipediaResult]] = None) -> SEOContext:
+        """Fetch and assemble the SEOContext for a keyword"""
+        self.logger.info("Building comprehensive context for: %s", keyword)
         
         start_time = time.time()
         
         # Fetch Wikipedia data
-        wikipedia_results = self.fetch_wikipedia_data(keyword)
+        if wikipedia_results is None:
+            wikipedia_results = self.fetch_wikipedia_data(keyword)
         
         # Extract related information
         related_keywords = self.extract_related_keywords(keyword, wikipedia_results)
@@ -343,7 +552,7 @@ class DataRetriever:
         context = SEOContext(
             keyword=keyword,
             user_goal=user_goal,
-            search_intent=f"{search_intent.value}: {intent_explanation}",
+            search_intent=f"{search_intent}: {intent_explanation}",
             related_keywords=related_keywords,
             wikipedia_data=wikipedia_results,
             content_opportunities=content_opportunities,
@@ -353,6 +562,24 @@ class DataRetriever:
         )
         
         processing_time = time.time() - start_time
-        self.logger.info(f"Context building completed in {processing_time:.2f} seconds")
+        self.logger.info("Context building completed in %.2f seconds", processing_time)
         
         return context
+    
+    def get_comprehensive_contexts(self, keywords: List[str], user_goal: str = "") -> Dict[str, SEOContext]:
+        """
+        Get comprehensive context for many keywords, fetching Wikipedia data in bulk
+        
+        Args:
+            keywords: Primary keywords
+            user_goal: User's goal or additional context
+            
+        Returns:
+            Mapping of keyword to its SEOContext
+        """
+        wikipedia_data = self.fetch_wikipedia_data_bulk(keywords)
+        
+        return {
+            keyword: self.get_comprehensive_context(keyword, user_goal, wikipedia_results=results)
+            for keyword, results in wikipedia_data.items()
+        }
@@ -0,0 +1,159 @@
+"""
+Semantic Response Cache for SEO Assistant Pipeline
+Caches generated responses by keyword/goal, matching paraphrased requests by embedding similarity
+"""
+
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, FrozenSet, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+from ..constants import (
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_SIZE,
+    RESPONSE_CACHE_VERSION,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD
+)
+
+KEYWORD_TOKEN_RE = re.compile(r"\w+")
+# Words that don't change what a keyword is about, ignored when comparing keywords
+KEYWORD_FILLER_WORDS = frozenset({"a", "an", "the", "and", "or", "of", "for", "to", "in", "on", "with", "vs"})
+
+
+def keyword_signature(keyword: str) -> FrozenSet[str]:
+    """Content words (including numbers) of a keyword, ignoring case, order and filler words"""
+    return frozenset(token for token in KEYWORD_TOKEN_RE.findall(keyword.lower()) if token not in KEYWORD_FILLER_WORDS)
+
+
+class SemanticCache:
+    """
+    Thread-safe response cache with exact and semantic lookups
+    
+    Exact (case-insensitive) matches are served from an LRU without computing
+    embeddings. On an exact miss, the request is embedded and compared against
+    cached entries with the same keyword and goal signatures (their content
+    words and numbers), so "iphone 14 price" can never be served "iphone 15
+    price", nor a "for kids, 500 words" goal the brief for "for engineers".
+    A cosine similarity at or above the threshold is a hit. Semantic matching
+    is skipped when sentence-transformers is not installed.
+    """
+    
+    def __init__(self, ttl: int = RESPONSE_CACHE_TTL, max_size: int = RESPONSE_CACHE_MAX_SIZE,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD, model_name: Optional[str] = SEMANTIC_CACHE_MODEL,
+                 version: str = RESPONSE_CACHE_VERSION, encoder: Optional[Any] = None):
+        """
+        Initialize semantic cache
+        
+        Args:
+            ttl: Entry lifetime in seconds
+            max_size: Maximum number of cached entries
+            threshold: Minimum cosine similarity for a semantic hit
+            model_name: sentence-transformers model (None disables semantic matching)
+            version: Cache version; bump when prompts change to invalidate entries
+            encoder: Optional pre-loaded embedding model to share between caches
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.threshold = threshold
+        self.version = version
+        self.logger = logging.getLogger(__name__)
+        
+        # key -> (value, expires_at, embedding, (keyword signature, goal signature))
+        self._entries: "OrderedDict[str, Tuple[Any, float, Any, Tuple[FrozenSet[str], FrozenSet[str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.encoder = encoder
+        if self.encoder is None and model_name:
+            if SentenceTransformer:
+                self.encoder = SentenceTransformer(model_name)
+            else:
+                self.logger.warning("sentence-transformers not installed, semantic matching disabled")
+    
+    def _key(self, keyword: str, goal: str = "") -> str:
+        return f"{self.version}\x00{keyword.strip().lower()}\x00{(goal or '').strip().lower()}"
+    
+    @staticmethod
+    def _signature(keyword: str, goal: str = "") -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Content words of the keyword and of the goal; both must match for a semantic hit"""
+        return keyword_signature(keyword), keyword_signature(goal or "")
+    
+    def _embed(self, keyword: str, goal: str = "") -> Optional[Any]:
+        if self.encoder is None or np is None:
+            return None
+        return self.encoder.encode(f"{keyword}|{goal or ''}", normalize_embeddings=True)
+    
+    def get(self, keyword: str, goal: str = "") -> Optional[Any]:
+        """Return a cached response for the request or a close paraphrase of it"""
+        key = self._key(keyword, goal)
+        now = time.time()
+        
+        signature = self._signature(keyword, goal)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+            
+            # Only entries for the same keyword and goal content can match; skip embedding when there are none
+            if not any(e[3] == signature for e in self._entries.values()):
+                return None
+        
+        embedding = self._embed(keyword, goal)
+        if embedding is None:
+            return None
+        
+        with self._lock:
+            live = [
+                (k, e) for k, e in self._entries.items()
+                if e[1] > now and e[2] is not None and e[3] == signature
+            ]
+            if not live:
+                return None
+            
+            similarities = np.stack([e[2] for _, e in live]) @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            
+            best_key, (value, _, _, _) = live[best]
+            self._entries.move_to_end(best_key)
+            self.logger.debug("Semantic cache hit for '%s' (similarity %.3f)", keyword, similarities[best])
+            return value
+    
+    def set(self, keyword: str, goal: str, value: Any):
+        """Cache a response for the request"""
+        embedding = self._embed(keyword, goal)
+        
+        key = self._key(keyword, goal)
+        
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl, embedding, self._signature(keyword, goal))
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
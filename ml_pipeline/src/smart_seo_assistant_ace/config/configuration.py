@@ -4,11 +4,15 @@ Handles loading and validation of configuration from various sources
 """
 
 import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 try:
     import yaml
+    # libyaml-backed loader/dumper when PyYAML was built with it
+    YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 except ImportError:
     yaml = None
 
@@ -20,11 +24,36 @@ except ImportError:
 from ..entity import PipelineConfig
 from ..constants import (
     GEMINI_MODEL_NAME,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GENERATION_CONCURRENCY,
     MAX_RETRIES,
     DEFAULT_TIMEOUT,
-    CONTEXT_CACHE_TTL
+    MAX_CONCURRENCY,
+    CONTEXT_CACHE_TTL,
+    CONTEXT_CACHE_DIR,
+    CONTEXT_CACHE_SIZE_BYTES
 )
 
+# Config keys stored as integers (converted from env vars and checked on validation)
+INTEGER_CONFIG_KEYS = (
+    "gemini_rpm", "generation_concurrency", "max_retries", "timeout",
+    "max_concurrency", "cache_ttl", "cache_size_bytes"
+)
+TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment flag as a boolean"""
+    return value.lower() in TRUTHY_VALUES
+
+
+# Converters for typed env var values; other keys are kept as strings
+ENV_CONVERTERS = {
+    "cache_enabled": _parse_bool,
+    "debug_mode": _parse_bool,
+    **dict.fromkeys(INTEGER_CONFIG_KEYS, int)
+}
+
 
 class ConfigurationManager:
     """Manages configuration loading and validation for the SEO pipeline"""
@@ -66,7 +95,7 @@ class ConfigurationManager:
             
         try:
             with open(self.config_file_path, 'r') as file:
-                yaml_config = yaml.safe_load(file)
+                yaml_config = yaml.load(file, Loader=YamlLoader)
                 if yaml_config:
                     self.config_data.update(yaml_config)
         except Exception as e:
@@ -76,10 +105,15 @@ class ConfigurationManager:
         """Load default configuration values"""
         defaults = {
             "gemini_model": GEMINI_MODEL_NAME,
+            "gemini_rpm": GEMINI_REQUESTS_PER_MINUTE,
+            "generation_concurrency": GENERATION_CONCURRENCY,
             "max_retries": MAX_RETRIES,
             "timeout": DEFAULT_TIMEOUT,
+            "max_concurrency": MAX_CONCURRENCY,
             "cache_enabled": True,
             "cache_ttl": CONTEXT_CACHE_TTL,
+            "cache_dir": CONTEXT_CACHE_DIR,
+            "cache_size_bytes": CONTEXT_CACHE_SIZE_BYTES,
             "debug_mode": False
         }
         
@@ -92,35 +126,42 @@ class ConfigurationManager:
         """Load configuration from environment variables"""
         env_mappings = {
             "GEMINI_MODEL": "gemini_model",
+            "GEMINI_RPM": "gemini_rpm",
+            "GENERATION_CONCURRENCY": "generation_concurrency",
             "MAX_RETRIES": "max_retries",
             "TIMEOUT": "timeout",
+            "MAX_CONCURRENCY": "max_concurrency",
             "CACHE_ENABLED": "cache_enabled",
             "CACHE_TTL": "cache_ttl",
+            "CACHE_DIR": "cache_dir",
+            "CACHE_SIZE_BYTES": "cache_size_bytes",
             "DEBUG_MODE": "debug_mode"
         }
         
+        env = os.environ
         for env_var, config_key in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
+            if env_var in env:
                 # Convert to appropriate type
-                self.config_data[config_key] = self._convert_env_value(env_value, config_key)
+                self.config_data[config_key] = self._convert_env_value(env[env_var], config_key)
+    
+    @staticmethod
+    def _get_api_key() -> Optional[str]:
+        """Get the Gemini API key, accepting GOOGLE_API_KEY for compatibility"""
+        env = os.environ
+        return env.get("GEMINI_API_KEY") or env.get("GOOGLE_API_KEY")
     
     def _convert_env_value(self, value: str, key: str) -> Any:
         """Convert environment variable string to appropriate type"""
-        # Boolean conversions
-        if key in ["cache_enabled", "debug_mode"]:
-            return value.lower() in ["true", "1", "yes", "on"]
+        converter = ENV_CONVERTERS.get(key)
+        if converter is None:
+            # String values
+            return value
         
-        # Integer conversions
-        if key in ["max_retries", "timeout", "cache_ttl"]:
-            try:
-                return int(value)
-            except ValueError:
-                print(f"Warning: Invalid integer value for {key}: {value}")
-                return self.config_data.get(key, 0)
-        
-        # String values
-        return value
+        try:
+            return converter(value)
+        except ValueError:
+            print(f"Warning: Invalid integer value for {key}: {value}")
+            return self.config_data.get(key, 0)
     
     def get_pipeline_config(self) -> PipelineConfig:
         """
@@ -132,8 +173,8 @@ class ConfigurationManager:
         Raises:
             ValueError: If required configuration is missing
         """
-        # Get API key (required) - check both GEMINI_API_KEY and GOOGLE_API_KEY for compatibility
-        api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        # Get API key (required)
+        api_key = self._get_api_key()
         if not api_key:
             raise ValueError(
                 "GEMINI_API_KEY environment variable is required. "
@@ -143,10 +184,15 @@ class ConfigurationManager:
         return PipelineConfig(
             gemini_api_key=api_key,
             gemini_model=self.config_data.get("gemini_model", GEMINI_MODEL_NAME),
+            gemini_rpm=self.config_data.get("gemini_rpm", GEMINI_REQUESTS_PER_MINUTE),
+            generation_concurrency=self.config_data.get("generation_concurrency", GENERATION_CONCURRENCY),
             max_retries=self.config_data.get("max_retries", MAX_RETRIES),
             timeout=self.config_data.get("timeout", DEFAULT_TIMEOUT),
+            max_concurrency=self.config_data.get("max_concurrency", MAX_CONCURRENCY),
             cache_enabled=self.config_data.get("cache_enabled", True),
             cache_ttl=self.config_data.get("cache_ttl", CONTEXT_CACHE_TTL),
+            cache_dir=self.config_data.get("cache_dir", CONTEXT_CACHE_DIR),
+            cache_size_bytes=self.config_data.get("cache_size_bytes", CONTEXT_CACHE_SIZE_BYTES),
             debug_mode=self.config_data.get("debug_mode", False)
         )
     
@@ -163,10 +209,16 @@ class ConfigurationManager:
         if not yaml:
             raise ImportError("PyYAML not installed, cannot save YAML config")
             
+        # Write to a temp file in the same directory and swap it in, so a crash
+        # never leaves a truncated config behind
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=".tmp")
         try:
-            with open(file_path, 'w') as file:
-                yaml.dump(self.config_data, file, default_flow_style=False)
+            with os.fdopen(fd, 'w') as file:
+                yaml.dump(self.config_data, file, Dumper=YamlDumper, default_flow_style=False)
+            os.replace(tmp_path, file_path)
         except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise IOError(f"Could not save config to {file_path}: {e}")
     
     def validate_config(self) -> bool:
@@ -184,13 +236,12 @@ class ConfigurationManager:
                 return False
         
         # Validate API key (accept GEMINI_API_KEY or GOOGLE_API_KEY for compatibility)
-        if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
+        if not self._get_api_key():
             print("Error: GEMINI_API_KEY (or GOOGLE_API_KEY) environment variable not found")
             return False
         
         # Validate numeric values
-        numeric_keys = ["max_retries", "timeout", "cache_ttl"]
-        for key in numeric_keys:
+        for key in INTEGER_CONFIG_KEYS:
             if key in self.config_data and not isinstance(self.config_data[key], int):
                 print(f"Error: {key} must be an integer")
                 return False
@@ -201,7 +252,7 @@ class ConfigurationManager:
         """String representation of configuration"""
         config_copy = self.config_data.copy()
         if yaml:
-            return f"SEO Pipeline Configuration:\n{yaml.dump(config_copy, default_flow_style=False)}"
+            return f"SEO Pipeline Configuration:\n{yaml.dump(config_copy, Dumper=YamlDumper, default_flow_style=False)}"
         else:
             return f"SEO Pipeline Configuration:\n{config_copy}"
 
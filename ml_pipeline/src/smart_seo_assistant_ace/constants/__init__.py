@@ -5,8 +5,16 @@ import os
 # API Configuration
 # Default to Gemini for current generator implementation; allow override via COMPLETION_MODEL
 GEMINI_MODEL_NAME = os.getenv("COMPLETION_MODEL", "gemini-1.5-flash")
+GEMINI_REQUESTS_PER_MINUTE = 60
+GEMINI_TRANSPORT = os.getenv("GEMINI_TRANSPORT", "grpc")  # grpc multiplexes calls over one HTTP/2 channel
+GENERATION_CONCURRENCY = 6  # Parallel Gemini calls per generator
+GEMINI_MAX_PARALLEL = int(os.getenv("GEMINI_MAX_PARALLEL", "8"))  # Gemini requests in flight across all callers
+GENERATION_CACHE_SIZE = 512  # Generated texts cached by exact prompt
 DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
+MAX_CONCURRENCY = 10
+HTTP_USER_AGENT = "smart-seo-assistant/1.0"  # Wikipedia asks API clients to identify themselves
+BULK_PROGRESS_LOG_INTERVAL = 50  # Log bulk progress every N keywords
 
 # Content Configuration
 DEFAULT_WORD_COUNT_TARGET = 1500
@@ -17,7 +25,9 @@ TITLE_OPTIMAL_LENGTH = 60
 
 # Context Configuration
 MAX_CONTEXT_LENGTH = 8000
+PROMPT_CONTEXT_CACHE_SIZE = 256  # Formatted prompt context blocks kept in memory
 WIKIPEDIA_RESULTS_LIMIT = 5
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
 RELATED_KEYWORDS_LIMIT = 10
 CONTENT_OPPORTUNITIES_LIMIT = 8
 USER_QUESTIONS_LIMIT = 8
@@ -44,6 +54,21 @@ CONTENT_TYPES = [
 # Cache Configuration
 CONTEXT_CACHE_TTL = 3600  # 1 hour in seconds
 MAX_CACHE_SIZE = 100
+WIKIPEDIA_VALIDATOR_CACHE_SIZE = 1000  # Search responses kept for ETag/Last-Modified revalidation
+CONTEXT_CACHE_DIR = ".seo_cache/context"
+CONTEXT_CACHE_SIZE_BYTES = 256 * 1024 * 1024  # 256 MB on disk
+
+# Response Cache Configuration (API semantic cache)
+RESPONSE_CACHE_TTL = 3600  # 1 hour in seconds
+RESPONSE_CACHE_MAX_SIZE = 1000
+RESPONSE_CACHE_VERSION = "1"  # Bump when prompts change to invalidate cached responses
+SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Batch Job Configuration
+BATCH_DIR = os.getenv("BATCH_DIR", ".seo_batches")
+BATCH_STATUS_INTERVAL = 10  # Persist batch progress every N keywords
+BATCH_POLL_INTERVAL = 5.0  # Seconds between scans for batches submitted by other workers
 
 # Performance Metrics
 PERFORMANCE_METRICS = [
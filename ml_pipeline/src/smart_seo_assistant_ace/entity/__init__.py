@@ -3,22 +3,58 @@ Entity classes for SEO Assistant Pipeline
 Data structures for handling SEO content generation workflow
 """
 
+import re
+import sys
+import json
+import time
+import hashlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class SearchIntent(Enum):
-    """Search intent classifications"""
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from ..constants import PROMPT_CONTEXT_CACHE_SIZE
+
+WORD_RE = re.compile(r'\S+')
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them"""
+    return sum(1 for _ in WORD_RE.finditer(text))
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() timestamp to a local datetime"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class SearchIntent(str, Enum):
+    """Search intent classifications (members are plain strings, so they serialize as-is)"""
     INFORMATIONAL = "informational"
     NAVIGATIONAL = "navigational"
     TRANSACTIONAL = "transactional"
     COMMERCIAL = "commercial"
+    
+    __str__ = str.__str__
 
 
-class ContentType(Enum):
-    """Content type classifications"""
+class ContentType(str, Enum):
+    """Content type classifications (members are plain strings, so they serialize as-is)"""
     BLOG_POST = "blog_post"
     GUIDE = "guide"
     TUTORIAL = "tutorial"
@@ -26,15 +62,68 @@ class ContentType(Enum):
     LISTICLE = "listicle"
     HOW_TO = "how_to"
     REVIEW = "review"
+    
+    __str__ = str.__str__
 
 
-@dataclass
-class WikipediaResult:
-    """Single Wikipedia search result"""
-    title: str
-    snippet: str
-    url: str
-    relevance_score: float = 0.0
+if msgspec:
+    class WikipediaResult(msgspec.Struct, frozen=True, gc=False):
+        """Single Wikipedia search result (untracked by the GC: it only holds strings and a float)"""
+        title: str
+        snippet: str
+        url: str
+        relevance_score: float = 0.0
+else:
+    @dataclass(frozen=True, **DATACLASS_SLOTS)
+    class WikipediaResult:
+        """Single Wikipedia search result"""
+        title: str
+        snippet: str
+        url: str
+        relevance_score: float = 0.0
+
+
+class PromptSlices(NamedTuple):
+    """Truncated, hashable views of an SEOContext used to build AI prompts"""
+    wikipedia: Tuple[Tuple[str, str], ...]
+    related_keywords: Tuple[str, ...]
+    opportunities: Tuple[str, ...]
+    questions: Tuple[str, ...]
+
+
+@lru_cache(maxsize=PROMPT_CONTEXT_CACHE_SIZE)
+def build_prompt_context(keyword: str, user_goal: str, search_intent: str,
+                         wikipedia: Tuple[Tuple[str, str], ...], related_keywords: Tuple[str, ...],
+                         opportunities: Tuple[str, ...], questions: Tuple[str, ...],
+                         competitive_landscape: str) -> str:
+    """Build the AI prompt context block from the slices of an SEOContext it uses"""
+    wikipedia_summary = "".join(f"\n{i}. {title}: {snippet}..." for i, (title, snippet) in enumerate(wikipedia, 1))
+    opportunity_lines = "\n".join(f"- {opp}" for opp in opportunities)
+    question_lines = "\n".join(f"- {q}" for q in questions)
+    
+    formatted_context = f"""
+        === SEO CONTEXT FOR "{keyword.upper()}" ===
+        
+        PRIMARY KEYWORD: {keyword}
+        USER GOAL: {user_goal or "Generate comprehensive SEO content"}
+        SEARCH INTENT: {search_intent}
+        
+        KNOWLEDGE BASE:{wikipedia_summary}
+        
+        RELATED KEYWORDS: {', '.join(related_keywords)}
+        
+        CONTENT OPPORTUNITIES:
+        {opportunity_lines}
+        
+        USER QUESTIONS:
+        {question_lines}
+        
+        COMPETITIVE LANDSCAPE: {competitive_landscape}
+        
+        === END CONTEXT ===
+        """
+    
+    return formatted_context
 
 
 @dataclass
@@ -48,7 +137,77 @@ class SEOContext:
     content_opportunities: List[str] = field(default_factory=list)
     competitive_landscape: str = ""
     user_questions: List[str] = field(default_factory=list)
-    retrieval_timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
+    retrieval_timestamp: float = field(default_factory=time.time)
+    
+    @cached_property
+    def keyword_lower(self) -> str:
+        """Lowercased keyword, computed once per context"""
+        return self.keyword.lower()
+    
+    @cached_property
+    def search_intent_lower(self) -> str:
+        """Lowercased search intent, computed once per context"""
+        return self.search_intent.lower()
+    
+    @cached_property
+    def top_opportunities(self) -> Tuple[str, ...]:
+        """Top content opportunities used as focus areas"""
+        return tuple(self.content_opportunities[:3])
+    
+    @cached_property
+    def top_questions(self) -> Tuple[str, ...]:
+        """Top user questions used as key questions"""
+        return tuple(self.user_questions[:3])
+    
+    @cached_property
+    def semantic_cluster(self) -> Tuple[str, ...]:
+        """Top related keywords forming the semantic cluster"""
+        return tuple(self.related_keywords[:5])
+    
+    @cached_property
+    def prompt_slices(self) -> PromptSlices:
+        """Slices of the context included in AI prompts, computed once per context"""
+        return PromptSlices(
+            wikipedia=tuple((result.title, result.snippet[:200]) for result in self.wikipedia_data[:3]),
+            related_keywords=tuple(self.related_keywords[:8]),
+            opportunities=tuple(self.content_opportunities[:6]),
+            questions=tuple(self.user_questions[:5])
+        )
+    
+    @cached_property
+    def prompt_context(self) -> str:
+        """Context block shared by every AI prompt for this context"""
+        return build_prompt_context(
+            self.keyword,
+            self.user_goal,
+            self.search_intent,
+            *self.prompt_slices,
+            self.competitive_landscape
+        )
+    
+    @cached_property
+    def processing_hints(self) -> Dict[str, Tuple[str, ...]]:
+        """Processing hints for context design, built once and shared across runs"""
+        return {
+            "focus_areas": self.top_opportunities,
+            "key_questions": self.top_questions,
+            "semantic_cluster": self.semantic_cluster
+        }
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Memoized to_dict() result; contexts are not modified after retrieval"""
+        return self.to_dict()
+    
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable hash of the context data, ignoring when it was retrieved"""
+        data = {key: value for key, value in self.as_dict.items() if key != "retrieval_timestamp"}
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            payload = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -84,7 +243,24 @@ class ContentBrief:
     cta_suggestions: List[str] = field(default_factory=list)
     optimization_tips: List[str] = field(default_factory=list)
     content_type: ContentType = ContentType.BLOG_POST
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    # Fields filled with template text because generation failed
+    fallback_fields: List[str] = field(default_factory=list)
+    
+    @property
+    def created_at(self) -> datetime:
+        """Creation time; stored as nanoseconds and only turned into a datetime on access"""
+        return ns_to_datetime(self.created_at_ns)
+    
+    @property
+    def used_fallback(self) -> bool:
+        """Whether any field holds fallback text instead of generated content"""
+        return bool(self.fallback_fields)
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Memoized to_dict() result; briefs are not modified after generation"""
+        return self.to_dict()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -97,12 +273,12 @@ class ContentBrief:
             "internal_links": self.internal_links,
             "cta_suggestions": self.cta_suggestions,
             "optimization_tips": self.optimization_tips,
-            "content_type": self.content_type.value,
+            "content_type": self.content_type,
             "created_at": self.created_at.isoformat()
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContentSection:
     """Individual content section"""
     heading: str
@@ -111,7 +287,7 @@ class ContentSection:
     
     def __post_init__(self):
         if self.word_count == 0:
-            self.word_count = len(self.content.split())
+            self.word_count = count_words(self.content)
 
 
 @dataclass 
@@ -125,15 +301,32 @@ class FullArticle:
     conclusion: str
     total_word_count: int = 0
     content_brief: Optional[ContentBrief] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    # Article parts filled with template text because generation failed
+    fallback_fields: List[str] = field(default_factory=list)
+    
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime"""
+        return ns_to_datetime(self.created_at_ns)
+    
+    @property
+    def used_fallback(self) -> bool:
+        """Whether the article or the brief it follows contains fallback text"""
+        return bool(self.fallback_fields) or (self.content_brief is not None and self.content_brief.used_fallback)
     
     def __post_init__(self):
         if self.total_word_count == 0:
-            intro_words = len(self.introduction.split())
+            intro_words = count_words(self.introduction)
             section_words = sum(section.word_count for section in self.sections)
-            conclusion_words = len(self.conclusion.split())
+            conclusion_words = count_words(self.conclusion)
             self.total_word_count = intro_words + section_words + conclusion_words
     
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Memoized to_dict() result; articles are not modified after generation"""
+        return self.to_dict()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -150,12 +343,12 @@ class FullArticle:
             ],
             "conclusion": self.conclusion,
             "total_word_count": self.total_word_count,
-            "content_brief": self.content_brief.to_dict() if self.content_brief else None,
+            "content_brief": self.content_brief.as_dict if self.content_brief else None,
             "created_at": self.created_at.isoformat()
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContentCalendarItem:
     """Single item in content calendar"""
     keyword: str
@@ -170,11 +363,11 @@ class ContentCalendarItem:
         return {
             "keyword": self.keyword,
             "title": self.title,
-            "content_type": self.content_type.value,
+            "content_type": self.content_type,
             "priority_score": self.priority_score,
             "estimated_difficulty": self.estimated_difficulty,
             "target_week": self.target_week,
-            "search_intent": self.search_intent.value
+            "search_intent": self.search_intent
         }
 
 
@@ -184,17 +377,25 @@ class ContentCalendar:
     timeframe_weeks: int
     total_keywords: int
     schedule: List[Dict[str, Any]] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    # week number -> (schedule entry, its highest priority score), kept alongside schedule
+    _weeks: Dict[int, List[Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime"""
+        return ns_to_datetime(self.created_at_ns)
+    
+    def __post_init__(self):
+        for week in self.schedule:
+            top_score = max((i.get("priority_score", 0) for i in week["items"]), default=float("-inf"))
+            self._weeks[week["week"]] = [week, top_score]
     
     def add_item(self, item: ContentCalendarItem):
         """Add item to appropriate week"""
-        week_data = None
-        for week in self.schedule:
-            if week["week"] == item.target_week:
-                week_data = week
-                break
+        bucket = self._weeks.get(item.target_week)
         
-        if not week_data:
+        if not bucket:
             week_data = {
                 "week": item.target_week,
                 "items": [],
@@ -202,15 +403,24 @@ class ContentCalendar:
                 "content_types": set()
             }
             self.schedule.append(week_data)
+            bucket = self._weeks[item.target_week] = [week_data, float("-inf")]
         
+        week_data = bucket[0]
         week_data["items"].append(item.to_dict())
-        week_data["content_types"].add(item.content_type.value)
+        week_data["content_types"].add(item.content_type)
         
-        # Set focus keyword to highest priority item
-        if not week_data["focus_keyword"] or item.priority_score > max(
-            [i.get("priority_score", 0) for i in week_data["items"]]
-        ):
+        # Set focus keyword to highest priority item, tracking the running max
+        if not week_data["focus_keyword"] or item.priority_score > bucket[1]:
             week_data["focus_keyword"] = item.keyword
+        bucket[1] = max(bucket[1], item.priority_score)
+        
+        # Drop the memoized dict now that the schedule changed
+        self.__dict__.pop("as_dict", None)
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Memoized to_dict() result, reset whenever an item is added"""
+        return self.to_dict()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -226,7 +436,7 @@ class ContentCalendar:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceMetrics:
     """Performance tracking for keywords"""
     keyword: str
@@ -234,7 +444,16 @@ class PerformanceMetrics:
     clicks: int = 0
     position: float = 0.0
     ctr: float = 0.0
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def last_updated(self) -> datetime:
+        """Last update time as a datetime"""
+        return ns_to_datetime(self.last_updated_ns)
+    
+    @last_updated.setter
+    def last_updated(self, value: datetime):
+        self.last_updated_ns = int(value.timestamp() * 1e9)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -247,23 +466,72 @@ class PerformanceMetrics:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PipelineConfig:
     """Configuration for SEO pipeline"""
     gemini_api_key: str
     gemini_model: str = "gemini-1.5-flash"
+    gemini_rpm: int = 60
+    generation_concurrency: int = 6
     max_retries: int = 3
     timeout: int = 10
+    max_concurrency: int = 10
     cache_enabled: bool = True
     cache_ttl: int = 3600
+    cache_dir: str = ".seo_cache/context"
+    cache_size_bytes: int = 256 * 1024 * 1024
     debug_mode: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "gemini_model": self.gemini_model,
+            "gemini_rpm": self.gemini_rpm,
+            "generation_concurrency": self.generation_concurrency,
             "max_retries": self.max_retries,
             "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
             "cache_enabled": self.cache_enabled,
             "cache_ttl": self.cache_ttl,
+            "cache_dir": self.cache_dir,
+            "cache_size_bytes": self.cache_size_bytes,
             "debug_mode": self.debug_mode
         }
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode values msgspec/orjson don't support natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# One encoder configured once and reused for every payload
+_JSON_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook) if msgspec else None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an entity or plain data to compact UTF-8 JSON bytes
+    
+    Entities are encoded through their memoized dict form (as_dict, else to_dict),
+    so the output matches what callers would get from encoding to_dict() themselves.
+    
+    Args:
+        obj: Entity instance, dict, list or scalar
+        
+    Returns:
+        JSON document as bytes
+    """
+    to_data = getattr(obj, "to_dict", None)
+    if to_data is not None:
+        obj = getattr(obj, "as_dict", None) or to_data()
+    
+    if _JSON_ENCODER is not None:
+        return _JSON_ENCODER.encode(obj)
+    if orjson:
+        return orjson.dumps(obj, default=_enc_hook)
+    return json.dumps(obj, default=_enc_hook, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -4,10 +4,20 @@ Orchestrates the complete workflow from keyword input to content generation
 """
 
 import time
+import heapq
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Callable, Iterator, AsyncIterator
 from datetime import datetime
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 from ..entity import (
     SEOContext, ContentBrief, FullArticle, ContentCalendar, 
     ContentCalendarItem, PerformanceMetrics, PipelineConfig, ContentType
@@ -15,7 +25,7 @@ from ..entity import (
 from ..components.data_retrieval import DataRetriever
 from ..components.content_generation import ContentGenerator
 from ..utils import generate_cache_key, merge_dictionaries
-from ..constants import CONTEXT_CACHE_TTL
+from ..constants import CONTEXT_CACHE_TTL, MAX_CACHE_SIZE, BULK_PROGRESS_LOG_INTERVAL, GENERATION_CACHE_SIZE
 
 
 class SEOAssistantPipeline:
@@ -37,52 +47,106 @@ class SEOAssistantPipeline:
         # Initialize components
         self.data_retriever = DataRetriever(
             timeout=config.timeout,
-            max_retries=config.max_retries
+            max_retries=config.max_retries,
+            pool_size=config.max_concurrency,
+            cache_size=0  # Contexts are cached by the pipeline (see _create_context_cache)
         )
         
         self.content_generator = ContentGenerator(
             api_key=config.gemini_api_key,
-            model_name=config.gemini_model
+            model_name=config.gemini_model,
+            requests_per_minute=config.gemini_rpm,
+            max_parallel_calls=config.generation_concurrency,
+            cache_size=GENERATION_CACHE_SIZE if config.cache_enabled else 0
         )
         
-        # Initialize cache if enabled
-        self.context_cache = {} if config.cache_enabled else None
+        # Initialize cache if enabled (persisted to disk when diskcache is available)
+        self.context_cache = self._create_context_cache() if config.cache_enabled else None
+        self._cache_lock = threading.Lock()
         self.performance_data = {}
         
         self.logger.info("SEO Assistant Pipeline initialized successfully")
     
-    def _get_cached_context(self, keyword: str, user_goal: str = "") -> Optional[SEOContext]:
-        """Get context from cache if available and not expired"""
-        if not self.context_cache:
+    def close(self):
+        """Release pooled HTTP connections, generator threads and the context cache"""
+        self.data_retriever.close()
+        self.content_generator.close()
+        
+        if self.context_cache is not None and not isinstance(self.context_cache, dict):
+            self.context_cache.close()
+    
+    def __enter__(self) -> "SEOAssistantPipeline":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _create_context_cache(self):
+        """Create the context cache, shared across processes via diskcache if installed
+        
+        Generated briefs and articles are stored in the same cache under
+        namespaced keys derived from the context fingerprint.
+        """
+        if diskcache:
+            return diskcache.Cache(self.config.cache_dir, size_limit=self.config.cache_size_bytes)
+        
+        self.logger.warning("diskcache not installed, falling back to in-memory context cache")
+        return {}
+    
+    def _cache_get(self, cache_key: str) -> Optional[Any]:
+        """Get a value from the cache if available and not expired"""
+        if self.context_cache is None:
             return None
         
-        cache_key = generate_cache_key(keyword, user_goal)
-        cached_item = self.context_cache.get(cache_key)
+        if not isinstance(self.context_cache, dict):
+            # diskcache handles expiry and eviction itself
+            return self.context_cache.get(cache_key)
         
-        if cached_item:
-            context, timestamp = cached_item
-            if time.time() - timestamp < self.config.cache_ttl:
-                self.logger.info(f"Using cached context for: {keyword}")
-                return context
-            else:
-                # Remove expired cache
-                del self.context_cache[cache_key]
+        with self._cache_lock:
+            cached_item = self.context_cache.get(cache_key)
+            
+            if cached_item:
+                value, timestamp = cached_item
+                if time.time() - timestamp < self.config.cache_ttl:
+                    return value
+                else:
+                    # Remove expired cache
+                    del self.context_cache[cache_key]
         
         return None
     
-    def _cache_context(self, context: SEOContext, user_goal: str = ""):
-        """Cache context data"""
-        if not self.context_cache:
+    def _cache_set(self, cache_key: str, value: Any):
+        """Store a value in the cache"""
+        if self.context_cache is None:
             return
         
-        cache_key = generate_cache_key(context.keyword, user_goal)
-        self.context_cache[cache_key] = (context, time.time())
+        if not isinstance(self.context_cache, dict):
+            self.context_cache.set(cache_key, value, expire=self.config.cache_ttl)
+            return
         
-        # Cleanup old cache entries if too many
-        if len(self.context_cache) > 100:  # Max cache size
-            oldest_key = min(self.context_cache.keys(), 
-                           key=lambda k: self.context_cache[k][1])
-            del self.context_cache[oldest_key]
+        with self._cache_lock:
+            self.context_cache[cache_key] = (value, time.time())
+            
+            # Cleanup old cache entries if too many
+            if len(self.context_cache) > MAX_CACHE_SIZE:
+                oldest_key = min(self.context_cache.keys(), 
+                               key=lambda k: self.context_cache[k][1])
+                del self.context_cache[oldest_key]
+    
+    def _get_cached_context(self, keyword: str, user_goal: str = "") -> Optional[SEOContext]:
+        """Get context from cache if available and not expired"""
+        context = self._cache_get(generate_cache_key(keyword, user_goal))
+        if context is not None:
+            self.logger.info("Using cached context for: %s", keyword)
+        return context
+    
+    def _cache_context(self, context: SEOContext, user_goal: str = ""):
+        """Cache context data"""
+        self._cache_set(generate_cache_key(context.keyword, user_goal), context)
+    
+    def _generation_cache_key(self, kind: str, context: SEOContext) -> str:
+        """Cache key for generated content, tied to the context data and model"""
+        return f"{kind}:{self.config.gemini_model}:{context.fingerprint}"
     
     # ===== A: ADVANCED RETRIEVAL =====
     
@@ -97,7 +161,7 @@ class SEOAssistantPipeline:
         Returns:
             SEOContext with comprehensive data
         """
-        self.logger.info(f"🔍 PHASE A: Advanced Retrieval for '{keyword}'")
+        self.logger.info("🔍 PHASE A: Advanced Retrieval for '%s'", keyword)
         
         # Check cache first
         cached_context = self._get_cached_context(keyword, user_goal)
@@ -113,10 +177,44 @@ class SEOAssistantPipeline:
         self._cache_context(context, user_goal)
         
         retrieval_time = time.time() - start_time
-        self.logger.info(f"✅ Advanced retrieval completed in {retrieval_time:.2f}s")
+        self.logger.info("✅ Advanced retrieval completed in %.2fs", retrieval_time)
         
         return context
     
+    def retrieve_contexts(self, keywords: List[str], user_goal: str = "") -> Dict[str, SEOContext]:
+        """
+        Advanced retrieval for many keywords, fetching uncached contexts in bulk
+        
+        Args:
+            keywords: Target keywords
+            user_goal: User's specific goal or context
+            
+        Returns:
+            Mapping of keyword to its SEOContext
+        """
+        contexts = {}
+        missing = []
+        
+        for keyword in dict.fromkeys(keywords):
+            cached_context = self._get_cached_context(keyword, user_goal)
+            if cached_context:
+                contexts[keyword] = cached_context
+            else:
+                missing.append(keyword)
+        
+        if missing:
+            self.logger.info("🔍 PHASE A: Bulk retrieval for %d keywords", len(missing))
+            start_time = time.time()
+            
+            fetched = self.data_retriever.get_comprehensive_contexts(missing, user_goal)
+            for context in fetched.values():
+                self._cache_context(context, user_goal)
+            contexts.update(fetched)
+            
+            self.logger.info("✅ Bulk retrieval completed in %.2fs", time.time() - start_time)
+        
+        return contexts
+    
     # ===== C: CONTEXT DESIGN =====
     
     def design_context(self, context: SEOContext) -> Dict[str, Any]:
@@ -129,7 +227,7 @@ class SEOAssistantPipeline:
         Returns:
             Optimized context data
         """
-        self.logger.info(f"🧠 PHASE C: Context Design for '{context.keyword}'")
+        self.logger.info("🧠 PHASE C: Context Design for '%s'", context.keyword)
         
         start_time = time.time()
         
@@ -146,17 +244,13 @@ class SEOAssistantPipeline:
         
         # Optimize context data
         optimized_context = {
-            "primary_data": context.to_dict(),
+            "primary_data": context.as_dict,
             "metrics": context_metrics,
-            "processing_hints": {
-                "focus_areas": context.content_opportunities[:3],
-                "key_questions": context.user_questions[:3],
-                "semantic_cluster": context.related_keywords[:5]
-            }
+            "processing_hints": context.processing_hints
         }
         
         design_time = time.time() - start_time
-        self.logger.info(f"✅ Context design completed in {design_time:.2f}s")
+        self.logger.info("✅ Context design completed in %.2fs", design_time)
         
         return optimized_context
     
@@ -196,15 +290,27 @@ class SEOAssistantPipeline:
         Returns:
             Generated content brief
         """
-        self.logger.info(f"⚡ PHASE E: Content Generation for '{context.keyword}'")
+        self.logger.info("⚡ PHASE E: Content Generation for '%s'", context.keyword)
+        
+        cache_key = self._generation_cache_key("brief", context)
+        cached_brief = self._cache_get(cache_key)
+        if cached_brief is not None:
+            self.logger.info("Using cached content brief for: %s", context.keyword)
+            return cached_brief
         
         start_time = time.time()
         
         # Generate content brief using content generator
         content_brief = self.content_generator.generate_content_brief(context)
+        if content_brief.used_fallback:
+            # Template text from a failed call must not be served to later requests
+            self.logger.warning("Not caching content brief for '%s', fallback used for: %s",
+                                context.keyword, ", ".join(content_brief.fallback_fields))
+        else:
+            self._cache_set(cache_key, content_brief)
         
         execution_time = time.time() - start_time
-        self.logger.info(f"✅ Content generation completed in {execution_time:.2f}s")
+        self.logger.info("✅ Content generation completed in %.2fs", execution_time)
         
         return content_brief
     
@@ -221,7 +327,7 @@ class SEOAssistantPipeline:
         Returns:
             Complete content brief
         """
-        self.logger.info(f"🚀 Starting SEO content brief generation for: '{keyword}'")
+        self.logger.info("🚀 Starting SEO content brief generation for: '%s'", keyword)
         
         pipeline_start = time.time()
         
@@ -237,13 +343,13 @@ class SEOAssistantPipeline:
             
             pipeline_time = time.time() - pipeline_start
             
-            self.logger.info(f"🎉 Pipeline completed successfully in {pipeline_time:.2f}s")
-            self.logger.info(f"Generated: {content_brief.title}")
+            self.logger.info("🎉 Pipeline completed successfully in %.2fs", pipeline_time)
+            self.logger.info("Generated: %s", content_brief.title)
             
             return content_brief
             
         except Exception as e:
-            self.logger.error(f"Pipeline failed for '{keyword}': {e}")
+            self.logger.error("Pipeline failed for '%s': %s", keyword, e)
             raise
     
     def generate_full_article(self, keyword: str, user_goal: str = "") -> FullArticle:
@@ -257,15 +363,25 @@ class SEOAssistantPipeline:
         Returns:
             Complete article
         """
-        self.logger.info(f"📝 Generating full article for: '{keyword}'")
+        self.logger.info("📝 Generating full article for: '%s'", keyword)
         
         # Get context
         context = self.retrieve_context(keyword, user_goal)
         
+        cache_key = self._generation_cache_key("article", context)
+        cached_article = self._cache_get(cache_key)
+        if cached_article is not None:
+            self.logger.info("Using cached article for: %s", keyword)
+            return cached_article
+        
         # Generate full article
         article = self.content_generator.generate_full_article(context)
+        if article.used_fallback:
+            self.logger.warning("Not caching article for '%s', it contains fallback content", keyword)
+        else:
+            self._cache_set(cache_key, article)
         
-        self.logger.info(f"✅ Full article generated: {article.total_word_count} words")
+        self.logger.info("✅ Full article generated: %d words", article.total_word_count)
         
         return article
     
@@ -280,40 +396,195 @@ class SEOAssistantPipeline:
         Returns:
             List of results for each keyword
         """
-        self.logger.info(f"📦 Bulk processing {len(keywords)} keywords")
+        return list(self.iter_bulk_process_keywords(keywords, user_goal))
+    
+    def iter_bulk_process_keywords(self, keywords: List[str], user_goal: str = "",
+                                   sink: Optional[Callable[[Dict[str, Any]], None]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Process multiple keywords in bulk, yielding each result as soon as it is ready
         
-        results = []
+        Only one content brief is held in memory at a time, so large batches can be
+        streamed to disk instead of accumulated.
+        
+        Args:
+            keywords: List of keywords to process
+            user_goal: Common user goal for all keywords
+            sink: Optional callable receiving each result (e.g. a JSONL writer)
+            
+        Yields:
+            Result dictionary for each keyword
+        """
+        total = len(keywords)
+        self.logger.info("📦 Bulk processing %d keywords", total)
+        
+        successful = 0
         start_time = time.time()
         
+        # Contexts are fetched in windows just ahead of the consumer, so the first
+        # result isn't held back by retrieval for the whole batch and a window
+        # never outgrows the context cache it warms
+        window = max(1, min(self.config.max_concurrency, MAX_CACHE_SIZE))
+        
         for i, keyword in enumerate(keywords, 1):
-            self.logger.info(f"Processing {i}/{len(keywords)}: '{keyword}'")
+            if self.context_cache is not None and (i - 1) % window == 0:
+                try:
+                    self.retrieve_contexts(keywords[i - 1:i - 1 + window], user_goal)
+                except Exception as e:
+                    # Warming is best effort; each keyword still retrieves its own context
+                    self.logger.warning("Context prefetch failed: %s", e)
             
-            try:
-                content_brief = self.generate_content_brief(keyword, user_goal)
-                
-                results.append({
-                    "keyword": keyword,
-                    "status": "success",
-                    "title": content_brief.title,
-                    "word_count_target": content_brief.word_count_target,
-                    "content_brief": content_brief.to_dict()
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Failed to process '{keyword}': {e}")
-                results.append({
-                    "keyword": keyword,
-                    "status": "failed",
-                    "error": str(e)
-                })
+            self.logger.debug("Processing %d/%d: '%s'", i, total, keyword)
+            if i % BULK_PROGRESS_LOG_INTERVAL == 0:
+                self.logger.info("Processed %d/%d keywords", i, total)
+            
+            result = self.process_bulk_keyword(keyword, user_goal)
+            if result["status"] == "success":
+                successful += 1
+            
+            if sink:
+                sink(result)
+            
+            yield result
+        
+        total_time = time.time() - start_time
+        
+        self.logger.info("📊 Bulk processing completed: %d/%d successful in %.2fs", successful, total, total_time)
+    
+    def bulk_process_keywords_concurrent(self, keywords: List[str], user_goal: str = "",
+                                         max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process multiple keywords in bulk using a bounded thread pool
+        
+        Wikipedia and Gemini calls are I/O bound, so worker threads overlap their
+        latency while sharing the pooled HTTP session. Results keep input order.
+        
+        Args:
+            keywords: List of keywords to process
+            user_goal: Common user goal for all keywords
+            max_workers: Worker thread count (defaults to config.max_concurrency)
+            
+        Returns:
+            List of results for each keyword
+        """
+        total = len(keywords)
+        max_workers = max_workers or self.config.max_concurrency
+        self.logger.info("📦 Bulk processing %d keywords with %d workers", total, max_workers)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        start_time = time.time()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.process_bulk_keyword, keyword, user_goal): index
+                for index, keyword in enumerate(keywords)
+            }
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if done % BULK_PROGRESS_LOG_INTERVAL == 0:
+                    self.logger.info("Processed %d/%d keywords", done, total)
         
         total_time = time.time() - start_time
         successful = sum(1 for r in results if r["status"] == "success")
         
-        self.logger.info(f"📊 Bulk processing completed: {successful}/{len(keywords)} successful in {total_time:.2f}s")
+        self.logger.info("📊 Bulk processing completed: %d/%d successful in %.2fs", successful, total, total_time)
         
         return results
     
+    async def abulk_process_keywords(self, keywords: List[str], user_goal: str = "",
+                                     max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process multiple keywords concurrently without blocking the event loop
+        
+        Each keyword runs in a worker thread, with at most max_concurrency in flight.
+        Results keep input order.
+        
+        Args:
+            keywords: List of keywords to process
+            user_goal: Common user goal for all keywords
+            max_concurrency: Maximum keywords in flight (defaults to config.max_concurrency)
+            
+        Returns:
+            List of results for each keyword
+        """
+        total = len(keywords)
+        self.logger.info("📦 Bulk processing %d keywords concurrently", total)
+        
+        start_time = time.time()
+        
+        results = await asyncio.gather(*self._bulk_keyword_tasks(keywords, user_goal, max_concurrency))
+        
+        total_time = time.time() - start_time
+        successful = sum(1 for r in results if r["status"] == "success")
+        
+        self.logger.info("📊 Bulk processing completed: %d/%d successful in %.2fs", successful, total, total_time)
+        
+        return list(results)
+    
+    async def aiter_bulk_process_keywords(self, keywords: List[str], user_goal: str = "",
+                                          max_concurrency: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process multiple keywords concurrently, yielding results in completion order
+        
+        Args:
+            keywords: List of keywords to process
+            user_goal: Common user goal for all keywords
+            max_concurrency: Maximum keywords in flight (defaults to config.max_concurrency)
+            
+        Yields:
+            Result dictionary for each keyword as soon as it completes
+        """
+        tasks = self._bulk_keyword_tasks(keywords, user_goal, max_concurrency)
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Stop outstanding work if the consumer goes away (e.g. client disconnect)
+            for task in tasks:
+                task.cancel()
+    
+    def _bulk_keyword_tasks(self, keywords: List[str], user_goal: str,
+                            max_concurrency: Optional[int]) -> List["asyncio.Task"]:
+        """Schedule one semaphore-bounded worker-thread task per keyword"""
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.max_concurrency)
+        
+        async def process_one(keyword: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.process_bulk_keyword, keyword, user_goal)
+        
+        return [asyncio.ensure_future(process_one(keyword)) for keyword in keywords]
+    
+    def process_bulk_keyword(self, keyword: str, user_goal: str = "") -> Dict[str, Any]:
+        """
+        Generate a content brief for a single bulk keyword, capturing failures
+        
+        Args:
+            keyword: Target keyword
+            user_goal: User's specific goal
+            
+        Returns:
+            Result dictionary with "status" set to "success" or "failed"
+        """
+        try:
+            content_brief = self.generate_content_brief(keyword, user_goal)
+            
+            return {
+                "keyword": keyword,
+                "status": "success",
+                "title": content_brief.title,
+                "word_count_target": content_brief.word_count_target,
+                "content_brief": content_brief.as_dict
+            }
+            
+        except Exception as e:
+            self.logger.error("Failed to process '%s': %s", keyword, e)
+            return {
+                "keyword": keyword,
+                "status": "failed",
+                "error": str(e)
+            }
+    
     def plan_content_calendar(self, keywords: List[str], timeframe_weeks: int = 4) -> ContentCalendar:
         """
         Plan content calendar for multiple keywords
@@ -325,7 +596,7 @@ class SEOAssistantPipeline:
         Returns:
             Content calendar
         """
-        self.logger.info(f"📅 Planning content calendar for {len(keywords)} keywords over {timeframe_weeks} weeks")
+        self.logger.info("📅 Planning content calendar for %d keywords over %d weeks", len(keywords), timeframe_weeks)
         
         calendar = ContentCalendar(
             timeframe_weeks=timeframe_weeks,
@@ -334,11 +605,17 @@ class SEOAssistantPipeline:
         
         # Analyze keywords and assign priorities
         keyword_items = []
+        try:
+            contexts = self.retrieve_contexts(keywords)
+        except Exception as e:
+            # Keywords are retried one by one below, so one bad keyword only drops itself
+            self.logger.warning("Bulk retrieval failed, retrieving keywords individually: %s", e)
+            contexts = {}
         
         for keyword in keywords:
             try:
                 # Get basic context for priority calculation
-                context = self.retrieve_context(keyword)
+                context = contexts.get(keyword) or self.retrieve_context(keyword)
                 
                 # Calculate priority score
                 priority_score = self._calculate_keyword_priority(context)
@@ -359,10 +636,10 @@ class SEOAssistantPipeline:
                 keyword_items.append(item)
                 
             except Exception as e:
-                self.logger.error(f"Failed to analyze keyword '{keyword}': {e}")
+                self.logger.error("Failed to analyze keyword '%s': %s", keyword, e)
         
         # Sort by priority and assign to weeks
-        keyword_items.sort(key=lambda x: x.priority_score, reverse=True)
+        keyword_items.sort(key=attrgetter("priority_score"), reverse=True)
         
         keywords_per_week = max(1, len(keyword_items) // timeframe_weeks)
         
@@ -374,7 +651,7 @@ class SEOAssistantPipeline:
             item.target_week = week
             calendar.add_item(item)
         
-        self.logger.info(f"✅ Content calendar planned with {len(keyword_items)} items")
+        self.logger.info("✅ Content calendar planned with %d items", len(keyword_items))
         
         return calendar
     
@@ -383,11 +660,12 @@ class SEOAssistantPipeline:
         score = 0.0
         
         # Search intent scoring
-        if "transactional" in context.search_intent.lower():
+        search_intent_lower = context.search_intent_lower
+        if "transactional" in search_intent_lower:
             score += 3.0
-        elif "commercial" in context.search_intent.lower():
+        elif "commercial" in search_intent_lower:
             score += 2.5
-        elif "informational" in context.search_intent.lower():
+        elif "informational" in search_intent_lower:
             score += 2.0
         
         # Content richness
@@ -399,7 +677,7 @@ class SEOAssistantPipeline:
     
     def _suggest_content_type(self, context: SEOContext) -> ContentType:
         """Suggest content type based on context"""
-        keyword_lower = context.keyword.lower()
+        keyword_lower = context.keyword_lower
         
         if "how to" in keyword_lower:
             return ContentType.HOW_TO
@@ -435,7 +713,7 @@ class SEOAssistantPipeline:
         
         self.performance_data[keyword] = performance
         
-        self.logger.info(f"📊 Performance tracked for '{keyword}': {metrics}")
+        self.logger.info("📊 Performance tracked for '%s': %s", keyword, metrics)
         
         return performance
     
@@ -445,16 +723,23 @@ class SEOAssistantPipeline:
             return {"message": "No performance data available"}
         
         total_keywords = len(self.performance_data)
-        total_clicks = sum(p.clicks for p in self.performance_data.values())
-        total_impressions = sum(p.impressions for p in self.performance_data.values())
-        avg_position = sum(p.position for p in self.performance_data.values()) / total_keywords
+        total_clicks = total_impressions = 0
+        total_position = 0.0
+        
+        # Aggregate every column in a single pass over the tracked metrics
+        for perf in self.performance_data.values():
+            total_clicks += perf.clicks
+            total_impressions += perf.impressions
+            total_position += perf.position
         
-        # Top performers
-        top_performers = sorted(
+        avg_position = total_position / total_keywords
+        
+        # Top performers (partial selection instead of a full sort)
+        top_performers = heapq.nlargest(
+            5,
             self.performance_data.items(),
-            key=lambda x: x[1].clicks,
-            reverse=True
-        )[:5]
+            key=lambda x: x[1].clicks
+        )
         
         return {
             "summary": {
@@ -477,7 +762,7 @@ class SEOAssistantPipeline:
     def get_pipeline_stats(self) -> Dict[str, Any]:
         """Get pipeline performance statistics"""
         return {
-            "cache_size": len(self.context_cache) if self.context_cache else 0,
+            "cache_size": len(self.context_cache) if self.context_cache is not None else 0,
             "performance_tracked_keywords": len(self.performance_data),
             "config": self.config.to_dict()
         }
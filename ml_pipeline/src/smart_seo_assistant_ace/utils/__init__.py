@@ -3,14 +3,59 @@ Utility functions for SEO Assistant Pipeline
 Common helper functions used across the pipeline
 """
 
+import re
 import time
+import random
+import bisect
+import asyncio
+import inspect
 import logging
+import threading
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional, Tuple, Type
 from functools import wraps
 import hashlib
 import json
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Keyword + goal lengths below which cache keys are stored verbatim rather than hashed
+INLINE_CACHE_KEY_MAX_LENGTH = 40
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\.\,\!\?\-\:\;]')
+
+# Punctuation clean_text leaves in place (everything else it keeps is \w or whitespace)
+KEPT_PUNCTUATION_TABLE = str.maketrans('', '', '.,!?-:;')
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
+SPACE_RE = re.compile(' ')
+
+# validate_seo_elements length buckets: bisect_right over (min, max + 1) picks
+# too short / within range / too long, with the penalty and issue for each
+TITLE_LENGTH_BOUNDS = (30, 61)
+TITLE_LENGTH_RULES = (
+    (20, "Title too short (recommended: 30-60 characters)"),
+    None,
+    (10, "Title too long (recommended: 30-60 characters)"),
+)
+META_LENGTH_BOUNDS = (120, 156)
+META_LENGTH_RULES = (
+    (15, "Meta description too short (recommended: 120-155 characters)"),
+    None,
+    (10, "Meta description too long (recommended: 120-155 characters)"),
+)
+
+# str.translate table deleting the ASCII characters DISALLOWED_CHARS_RE removes
+ASCII_DISALLOWED_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) in "_.,!?-:;")
+}
+
 
 def setup_logging(debug_mode: bool = False) -> logging.Logger:
     """
@@ -33,15 +78,53 @@ def setup_logging(debug_mode: bool = False) -> logging.Logger:
     return logging.getLogger(__name__)
 
 
-def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0):
+def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0,
+                       giveup: Tuple[Type[BaseException], ...] = (),
+                       max_delay: Optional[float] = None, jitter: bool = False):
     """
     Decorator for retrying functions with exponential backoff
     
+    Coroutine functions are retried with asyncio.sleep between attempts, so
+    backoff never blocks the event loop.
+    
     Args:
         max_retries: Maximum number of retry attempts
         backoff_factor: Factor for exponential backoff
+        giveup: Exception types raised immediately without retrying
+        max_delay: Optional cap on any single delay in seconds
+        jitter: Sleep a random time up to each delay, so concurrent callers spread out
     """
+    # Delay before each retry, computed once per decorated function
+    delays = tuple(
+        backoff_factor * (1 << attempt) if max_delay is None else min(max_delay, backoff_factor * (1 << attempt))
+        for attempt in range(max_retries)
+    )
+    
+    def delay_for(attempt: int) -> float:
+        return random.uniform(0, delays[attempt]) if jitter else delays[attempt]
+    
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except giveup:
+                        raise
+                    except Exception as e:
+                        last_exception = e
+                        
+                        if attempt == max_retries:
+                            break
+                        
+                        await asyncio.sleep(delay_for(attempt))
+                
+                raise last_exception
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
@@ -49,21 +132,56 @@ def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0):
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
+                except giveup:
+                    raise
                 except Exception as e:
                     last_exception = e
                     
                     if attempt == max_retries:
                         break
                     
-                    # Calculate delay with exponential backoff
-                    delay = backoff_factor * (2 ** attempt)
-                    time.sleep(delay)
+                    time.sleep(delay_for(attempt))
                     
             raise last_exception
         return wrapper
     return decorator
 
 
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls evenly to stay within a quota
+    
+    Args:
+        calls: Allowed calls per period (0 disables limiting)
+        period: Period length in seconds
+    """
+    
+    def __init__(self, calls: int, period: float = 60.0):
+        self.interval = period / calls if calls > 0 else 0.0
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the next call is allowed"""
+        if not self.interval:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        
+        if delay > 0:
+            time.sleep(delay)
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
 def calculate_text_similarity(text1: str, text2: str) -> float:
     """
     Calculate simple text similarity score
@@ -82,13 +200,47 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     words1 = set(text1.lower().split())
     words2 = set(text2.lower().split())
     
-    # Calculate Jaccard similarity
+    # Calculate Jaccard similarity, deriving the union size instead of building the union set
     intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
+    union = len(words1) + len(words2) - intersection
     
     return intersection / union if union > 0 else 0.0
 
 
+def calculate_similarity_batch(query: str, candidates: List[str]) -> List[float]:
+    """
+    Calculate calculate_text_similarity between one query and many candidates
+    
+    The query is tokenized once, and each union size is derived from the
+    intersection instead of building a second set per candidate.
+    
+    Args:
+        query: Query text
+        candidates: Texts to compare against the query
+        
+    Returns:
+        Similarity scores between 0 and 1, aligned with candidates
+    """
+    if not query:
+        return [0.0] * len(candidates)
+    
+    query_words = set(query.lower().split())
+    query_size = len(query_words)
+    scores = []
+    
+    for candidate in candidates:
+        if not candidate:
+            scores.append(0.0)
+            continue
+        
+        candidate_words = set(candidate.lower().split())
+        intersection = len(query_words.intersection(candidate_words))
+        union = query_size + len(candidate_words) - intersection
+        scores.append(intersection / union if union > 0 else 0.0)
+    
+    return scores
+
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize text
@@ -102,15 +254,15 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove HTML tags (basic)
-    import re
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove HTML tags (basic), including MediaWiki search highlight spans
+    text = HTML_TAG_RE.sub('', text)
     
     # Remove extra whitespace
     text = ' '.join(text.split())
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\.\,\!\?\-\:\;]', '', text)
+    # translate skips the regex engine for the common all-ASCII case
+    text = text.translate(ASCII_DISALLOWED_TABLE) if text.isascii() else DISALLOWED_CHARS_RE.sub('', text)
     
     return text.strip()
 
@@ -129,31 +281,13 @@ def extract_keywords_from_text(text: str, min_length: int = 4) -> List[str]:
     if not text:
         return []
     
-    import re
-    
-    # Clean text first
-    cleaned_text = clean_text(text)
-    
-    # Split into words
-    words = cleaned_text.lower().split()
-    
-    # Filter words
-    keywords = []
-    for word in words:
-        # Remove punctuation and check length
-        clean_word = re.sub(r'[^\w]', '', word)
-        if len(clean_word) >= min_length and clean_word.isalpha():
-            keywords.append(clean_word.title())
+    # Clean text first, then drop the punctuation clean_text keeps, in one pass
+    words = clean_text(text).lower().translate(KEPT_PUNCTUATION_TABLE).split()
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-    
-    return unique_keywords
+    # Filter by length, keeping purely alphabetic words, and remove duplicates in order
+    return list(dict.fromkeys(
+        word.title() for word in words if len(word) >= min_length and word.isalpha()
+    ))
 
 
 def generate_cache_key(keyword: str, user_goal: str = "") -> str:
@@ -167,11 +301,27 @@ def generate_cache_key(keyword: str, user_goal: str = "") -> str:
     Returns:
         Cache key string
     """
-    # Combine keyword and user goal
-    cache_input = f"{keyword.lower()}_{user_goal.lower()}"
+    keyword, user_goal = keyword.lower(), user_goal.lower()
+    
+    # Short ASCII inputs are used as-is; hashing them would only add work.
+    # The keyword may not contain "|" so the pair splits unambiguously.
+    if (len(keyword) + len(user_goal) < INLINE_CACHE_KEY_MAX_LENGTH and
+            keyword.isascii() and user_goal.isascii() and "|" not in keyword):
+        return f"k:{keyword}|g:{user_goal}"
+    
+    # Combine keyword and user goal (NUL separator keeps the pair unambiguous)
+    cache_input = f"{keyword}\x00{user_goal}"
+    
+    # Generate hash (xxh3 when available, otherwise blake2b, which outpaces md5)
+    if xxhash:
+        return xxhash.xxh3_64_hexdigest(cache_input)
     
-    # Generate hash
-    return hashlib.md5(cache_input.encode()).hexdigest()
+    return hashlib.blake2b(cache_input.encode(), digest_size=16).hexdigest()
+
+
+# Outline items starting with one of these are rendered as h2, all others as h3
+OUTLINE_SECTION_PREFIXES = frozenset({'1.', '2.', '3.', '4.', '5.'})
+OUTLINE_MARKER_CHARS = '1234567890.-•abcdefgh'
 
 
 def format_outline_as_html(outline: List[str]) -> str:
@@ -190,15 +340,10 @@ def format_outline_as_html(outline: List[str]) -> str:
     html_parts = ["<div class='content-outline'>"]
     
     for item in outline:
-        # Determine heading level based on numbering/indentation
-        if item.strip().startswith(('1.', '2.', '3.', '4.', '5.')):
-            level = "h2"
-        elif item.strip().startswith(('a.', 'b.', 'c.', '-', '•')):
-            level = "h3"
-        else:
-            level = "h3"
-        
-        clean_item = item.strip().lstrip('1234567890.-•abcdefgh').strip()
+        stripped = item.strip()
+        # Numbered items are top-level sections, everything else is a subsection
+        level = "h2" if stripped[:2] in OUTLINE_SECTION_PREFIXES else "h3"
+        clean_item = stripped.lstrip(OUTLINE_MARKER_CHARS).strip()
         html_parts.append(f"<{level}>{clean_item}</{level}>")
     
     html_parts.append("</div>")
@@ -216,45 +361,31 @@ def validate_seo_elements(title: str, meta_description: str) -> Dict[str, Any]:
     Returns:
         Validation results with recommendations
     """
-    results = {
-        "title": {"valid": True, "issues": [], "score": 100},
-        "meta_description": {"valid": True, "issues": [], "score": 100}
+    return {
+        "title": _validate_length(title, TITLE_LENGTH_BOUNDS, TITLE_LENGTH_RULES, "Title is required"),
+        "meta_description": _validate_length(meta_description, META_LENGTH_BOUNDS, META_LENGTH_RULES,
+                                             "Meta description is required")
     }
+
+
+def _validate_length(text: str, bounds: Tuple[int, int], rules: Tuple[Optional[Tuple[int, str]], ...],
+                     required_issue: str) -> Dict[str, Any]:
+    """Score one SEO element by its length bucket; valid means a score above 70"""
+    issues = []
+    score = 100
+    
+    # Bucket 0 is too short, 1 is within range, 2 is too long
+    rule = rules[bisect.bisect_right(bounds, len(text))]
+    if rule:
+        penalty, issue = rule
+        issues.append(issue)
+        score -= penalty
     
-    # Title validation
-    title_length = len(title)
-    if title_length < 30:
-        results["title"]["issues"].append("Title too short (recommended: 30-60 characters)")
-        results["title"]["score"] -= 20
-    elif title_length > 60:
-        results["title"]["issues"].append("Title too long (recommended: 30-60 characters)")
-        results["title"]["score"] -= 10
-    
-    if not title:
-        results["title"]["valid"] = False
-        results["title"]["issues"].append("Title is required")
-        results["title"]["score"] = 0
-    
-    # Meta description validation
-    meta_length = len(meta_description)
-    if meta_length < 120:
-        results["meta_description"]["issues"].append("Meta description too short (recommended: 120-155 characters)")
-        results["meta_description"]["score"] -= 15
-    elif meta_length > 155:
-        results["meta_description"]["issues"].append("Meta description too long (recommended: 120-155 characters)")
-        results["meta_description"]["score"] -= 10
-    
-    if not meta_description:
-        results["meta_description"]["valid"] = False
-        results["meta_description"]["issues"].append("Meta description is required")
-        results["meta_description"]["score"] = 0
-    
-    # Overall validation
-    if results["title"]["issues"] or results["meta_description"]["issues"]:
-        results["title"]["valid"] = results["title"]["score"] > 70
-        results["meta_description"]["valid"] = results["meta_description"]["score"] > 70
+    if not text:
+        issues.append(required_issue)
+        score = 0
     
-    return results
+    return {"valid": score > 70, "issues": issues, "score": score}
 
 
 def estimate_reading_time(word_count: int, wpm: int = 200) -> int:
@@ -287,14 +418,12 @@ def generate_content_slug(title: str) -> str:
     if not title:
         return ""
     
-    import re
-    
     # Convert to lowercase
     slug = title.lower()
     
     # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = SLUG_STRIP_RE.sub('', slug)
+    slug = SLUG_SEPARATOR_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -306,6 +435,31 @@ def generate_content_slug(title: str) -> str:
     return slug
 
 
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide session used by safe_request
+    
+    Created on first use (after any worker fork) so keep-alive connections
+    are pooled per host across calls instead of reopened for each request.
+    """
+    global _shared_session
+    
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _shared_session = session
+    
+    return _shared_session
+
+
 def safe_request(url: str, timeout: int = 10, **kwargs) -> Optional[requests.Response]:
     """
     Make a safe HTTP request with error handling
@@ -319,7 +473,7 @@ def safe_request(url: str, timeout: int = 10, **kwargs) -> Optional[requests.Res
         Response object or None if failed
     """
     try:
-        response = requests.get(url, timeout=timeout, **kwargs)
+        response = get_shared_session().get(url, timeout=timeout, **kwargs)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
@@ -344,16 +498,20 @@ def chunk_text(text: str, max_length: int = 2000, overlap: int = 100) -> List[st
     
     chunks = []
     start = 0
+    text_length = len(text)
+    
+    # Space offsets, scanned once so each boundary lookup is a binary search
+    space_positions = [match.start() for match in SPACE_RE.finditer(text)]
     
-    while start < len(text):
+    while start < text_length:
         end = start + max_length
         
         # Try to break at word boundary
-        if end < len(text):
+        if end < text_length:
             # Find last space before the end
-            last_space = text.rfind(' ', start, end)
-            if last_space > start:
-                end = last_space
+            index = bisect.bisect_left(space_positions, end) - 1
+            if index >= 0 and space_positions[index] > start:
+                end = space_positions[index]
         
         chunk = text[start:end].strip()
         if chunk:
@@ -365,6 +523,9 @@ def chunk_text(text: str, max_length: int = 2000, overlap: int = 100) -> List[st
     return chunks
 
 
+_MISSING = object()
+
+
 def merge_dictionaries(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     """
     Merge multiple dictionaries with conflict resolution
@@ -378,16 +539,25 @@ def merge_dictionaries(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     result = {}
     
     for d in dicts:
-        for key, value in d.items():
-            if key in result:
+        # Worklist of (target, source) merges instead of recursing into nested dicts
+        pending = [(result, d)]
+        
+        while pending:
+            target, source = pending.pop()
+            
+            for key, value in source.items():
+                current = target.get(key, _MISSING)
+                
+                if current is _MISSING:
+                    target[key] = value
                 # Handle conflicts - prioritize non-empty values
-                if not result[key] and value:
-                    result[key] = value
-                elif isinstance(result[key], list) and isinstance(value, list):
-                    result[key].extend(value)
-                elif isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = merge_dictionaries(result[key], value)
-            else:
-                result[key] = value
+                elif not current and value:
+                    target[key] = value
+                elif isinstance(current, list) and isinstance(value, list):
+                    current.extend(value)
+                elif isinstance(current, dict) and isinstance(value, dict):
+                    # Merge into a copy so the input dictionaries are left untouched
+                    target[key] = merged = dict(current)
+                    pending.append((merged, value))
     
     return result
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSONL batch runner's crash recovery
+
+Uses a stub pipeline, so no Gemini or Wikipedia calls are made.
+
+Run with pytest, or directly:
+    python test_batch_runner.py
+"""
+
+import sys
+import time
+import json
+import tempfile
+import traceback
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root / "src"))
+
+from smart_seo_assistant_ace.components.batch_runner import BatchRunner, fcntl
+
+
+class StubPipeline:
+    """Records processed keywords; failed_keywords come back as errors"""
+
+    def __init__(self, failed_keywords=(), on_keyword=None):
+        self.calls = []
+        self.failed_keywords = set(failed_keywords)
+        self.on_keyword = on_keyword
+
+    def process_bulk_keyword(self, keyword, goal=""):
+        self.calls.append(keyword)
+        if self.on_keyword:
+            self.on_keyword(keyword)
+        if keyword in self.failed_keywords:
+            return {"keyword": keyword, "status": "error", "error": "stub failure"}
+        return {"keyword": keyword, "status": "success"}
+
+
+def make_batch(runner, keywords):
+    body = "\n".join(json.dumps({"keyword": keyword}) for keyword in keywords).encode()
+    return runner.submit(body)["id"]
+
+
+def read_results(runner, batch_id):
+    return runner.results_path(batch_id).read_bytes().decode().splitlines(keepends=True)
+
+
+def test_resume_truncates_partial_line():
+    with tempfile.TemporaryDirectory() as batch_dir:
+        pipeline = StubPipeline()
+        runner = BatchRunner(pipeline, batch_dir)
+        batch_id = make_batch(runner, ["k1", "k2", "k3", "k4"])
+
+        # Two results written before the crash, the third cut off mid-write
+        with open(runner.results_path(batch_id), "wb") as f:
+            f.write(b'{"keyword": "k1", "status": "success"}\n')
+            f.write(b'{"keyword": "k2", "status": "error"}\n')
+            f.write(b'{"keyword": "k3", "sta')
+
+        runner._run(batch_id)
+
+        lines = read_results(runner, batch_id)
+        assert len(lines) == 4
+        assert all(line.endswith("\n") for line in lines)
+        assert [json.loads(line)["keyword"] for line in lines] == ["k1", "k2", "k3", "k4"]
+        assert pipeline.calls == ["k3", "k4"]
+
+        status = runner.get_status(batch_id)
+        assert status["status"] == "completed"
+        assert (status["processed"], status["successful"], status["failed"]) == (4, 3, 1)
+
+
+def test_pause_when_stopping():
+    with tempfile.TemporaryDirectory() as batch_dir:
+        runner = BatchRunner(None, batch_dir)
+
+        def stop_after_second(keyword):
+            if keyword == "k2":
+                runner._stopping.set()
+
+        runner.pipeline = StubPipeline(on_keyword=stop_after_second)
+        batch_id = make_batch(runner, ["k1", "k2", "k3", "k4"])
+
+        runner._run(batch_id)
+
+        assert runner.pipeline.calls == ["k1", "k2"]
+        assert len(read_results(runner, batch_id)) == 2
+        status = runner.get_status(batch_id)
+        assert status["status"] == "running"
+        assert status["processed"] == 2
+
+        # The next owner carries on from where the batch paused
+        runner._stopping.clear()
+        runner.pipeline = StubPipeline()
+        runner._run(batch_id)
+
+        assert runner.pipeline.calls == ["k3", "k4"]
+        assert runner.get_status(batch_id)["status"] == "completed"
+
+
+def test_failure_while_stopping_is_not_recorded():
+    with tempfile.TemporaryDirectory() as batch_dir:
+        runner = BatchRunner(None, batch_dir)
+
+        def shutdown_during_second(keyword):
+            if keyword == "k2":
+                runner._stopping.set()
+
+        runner.pipeline = StubPipeline(failed_keywords=["k2"], on_keyword=shutdown_during_second)
+        batch_id = make_batch(runner, ["k1", "k2", "k3"])
+
+        runner._run(batch_id)
+
+        assert [json.loads(line)["keyword"] for line in read_results(runner, batch_id)] == ["k1"]
+        status = runner.get_status(batch_id)
+        assert status["status"] == "running"
+        assert (status["processed"], status["failed"]) == (1, 0)
+
+
+def test_directory_lock():
+    if fcntl is None:
+        print("   fcntl not available, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as batch_dir:
+        owner = BatchRunner(StubPipeline(), batch_dir)
+        other = BatchRunner(StubPipeline(), batch_dir)
+
+        owner.start()
+        try:
+            assert other._acquire_lock() is False
+        finally:
+            assert owner.stop() is True
+
+        assert other._acquire_lock() is True
+        other._release_lock()
+
+
+def test_start_resumes_unfinished_batch():
+    with tempfile.TemporaryDirectory() as batch_dir:
+        pipeline = StubPipeline()
+        runner = BatchRunner(pipeline, batch_dir)
+        batch_id = make_batch(runner, ["k1", "k2"])
+
+        runner.start()
+        try:
+            deadline = time.monotonic() + 5
+            while runner.get_status(batch_id)["status"] != "completed" and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            runner.stop()
+
+        assert runner.get_status(batch_id)["status"] == "completed"
+        assert pipeline.calls == ["k1", "k2"]
+
+
+def main():
+    """Run all tests in this module"""
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_") and callable(func)]
+    failed = 0
+
+    for name, func in tests:
+        try:
+            func()
+            print(f"✅ {name}")
+        except Exception:
+            failed += 1
+            print(f"❌ {name}")
+            traceback.print_exc()
+
+    print(f"\nOverall: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the API semantic response cache
+
+Uses a stub encoder, so no sentence-transformers model is downloaded.
+
+Run with pytest, or directly:
+    python test_semantic_cache.py
+"""
+
+import sys
+import traceback
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root / "src"))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from smart_seo_assistant_ace.components.semantic_cache import SemanticCache, keyword_signature
+
+
+class ConstantEncoder:
+    """Embeds every request to the same unit vector, so any signature match is a semantic hit"""
+
+    def encode(self, text, normalize_embeddings=True):
+        return np.array([1.0, 0.0])
+
+
+def make_cache(**kwargs) -> SemanticCache:
+    return SemanticCache(model_name=None, encoder=ConstantEncoder(), **kwargs)
+
+
+def semantic_matching_available() -> bool:
+    """Semantic lookups need numpy; report a skip when it is missing"""
+    if np is None:
+        print("   numpy not installed, skipping")
+        return False
+    return True
+
+
+def test_keyword_signature():
+    assert keyword_signature("Price of iPhone 14") == keyword_signature("iphone 14 price")
+    assert keyword_signature("iphone 14 price") != keyword_signature("iphone 15 price")
+    assert keyword_signature("The best tools for SEO") == frozenset({"best", "tools", "seo"})
+    assert keyword_signature("") == frozenset()
+
+
+def test_exact_hit():
+    cache = SemanticCache(model_name=None)
+    cache.set("SEO Tips", "", {"title": "a"})
+    assert cache.get("seo tips ") == {"title": "a"}
+    assert cache.get("seo tips", "other goal") is None
+
+
+def test_ttl_expiry():
+    cache = SemanticCache(ttl=0, model_name=None)
+    cache.set("seo tips", "", "value")
+    assert cache.get("seo tips") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = SemanticCache(max_size=2, model_name=None)
+    cache.set("first", "", 1)
+    cache.set("second", "", 2)
+    assert cache.get("first") == 1  # first is now the most recently used
+    cache.set("third", "", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_no_hit_across_keyword_signatures():
+    if not semantic_matching_available():
+        return
+
+    cache = make_cache()
+    cache.set("iphone 14 price", "", "iphone 14")
+    assert cache.get("iphone 15 price") is None
+
+
+def test_no_hit_across_goal_signatures():
+    if not semantic_matching_available():
+        return
+
+    cache = make_cache()
+    cache.set("python tutorial", "for engineers, 1500 words", "engineers")
+    assert cache.get("python tutorial", "for kids, 500 words") is None
+
+
+def test_semantic_hit_with_same_signature():
+    if not semantic_matching_available():
+        return
+
+    cache = make_cache()
+    cache.set("iphone 14 price", "for buyers", "iphone 14")
+    assert cache.get("Price of iPhone 14", "For buyers") == "iphone 14"
+
+
+def main():
+    """Run all tests in this module"""
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_") and callable(func)]
+    failed = 0
+
+    for name, func in tests:
+        try:
+            func()
+            print(f"✅ {name}")
+        except Exception:
+            failed += 1
+            print(f"❌ {name}")
+            traceback.print_exc()
+
+    print(f"\nOverall: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for the text utilities
+
+The optimized helpers in smart_seo_assistant_ace.utils are checked against
+the straightforward implementations they replaced, over boundary tables and
+seeded random inputs, so rewrites can't silently change their output.
+
+Run with pytest, or directly:
+    python test_utils.py
+"""
+
+import re
+import sys
+import random
+import traceback
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root / "src"))
+
+from smart_seo_assistant_ace.utils import (
+    calculate_text_similarity,
+    chunk_text,
+    extract_keywords_from_text,
+    format_outline_as_html,
+    merge_dictionaries,
+    validate_seo_elements
+)
+
+
+# ===== Reference implementations (the original, unoptimized versions) =====
+
+def reference_clean_text(text):
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = ' '.join(text.split())
+    text = re.sub(r'[^\w\s\.\,\!\?\-\:\;]', '', text)
+    return text.strip()
+
+
+def reference_extract_keywords(text, min_length=4):
+    if not text:
+        return []
+    keywords = []
+    for word in reference_clean_text(text).lower().split():
+        clean_word = re.sub(r'[^\w]', '', word)
+        if len(clean_word) >= min_length and clean_word.isalpha():
+            keywords.append(clean_word.title())
+    return list(dict.fromkeys(keywords))
+
+
+def reference_validate_seo_elements(title, meta_description):
+    results = {
+        "title": {"valid": True, "issues": [], "score": 100},
+        "meta_description": {"valid": True, "issues": [], "score": 100}
+    }
+
+    if len(title) < 30:
+        results["title"]["issues"].append("Title too short (recommended: 30-60 characters)")
+        results["title"]["score"] -= 20
+    elif len(title) > 60:
+        results["title"]["issues"].append("Title too long (recommended: 30-60 characters)")
+        results["title"]["score"] -= 10
+    if not title:
+        results["title"]["valid"] = False
+        results["title"]["issues"].append("Title is required")
+        results["title"]["score"] = 0
+
+    if len(meta_description) < 120:
+        results["meta_description"]["issues"].append("Meta description too short (recommended: 120-155 characters)")
+        results["meta_description"]["score"] -= 15
+    elif len(meta_description) > 155:
+        results["meta_description"]["issues"].append("Meta description too long (recommended: 120-155 characters)")
+        results["meta_description"]["score"] -= 10
+    if not meta_description:
+        results["meta_description"]["valid"] = False
+        results["meta_description"]["issues"].append("Meta description is required")
+        results["meta_description"]["score"] = 0
+
+    if results["title"]["issues"] or results["meta_description"]["issues"]:
+        results["title"]["valid"] = results["title"]["score"] > 70
+        results["meta_description"]["valid"] = results["meta_description"]["score"] > 70
+
+    return results
+
+
+def reference_chunk_text(text, max_length=2000, overlap=100):
+    if not text or len(text) <= max_length:
+        return [text] if text else []
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + max_length
+        if end < len(text):
+            last_space = text.rfind(' ', start, end)
+            if last_space > start:
+                end = last_space
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = max(start + 1, end - overlap)
+    return chunks
+
+
+def reference_merge_dictionaries(*dicts):
+    result = {}
+    for d in dicts:
+        for key, value in d.items():
+            if key in result:
+                if not result[key] and value:
+                    result[key] = value
+                elif isinstance(result[key], list) and isinstance(value, list):
+                    result[key].extend(value)
+                elif isinstance(result[key], dict) and isinstance(value, dict):
+                    result[key] = reference_merge_dictionaries(result[key], value)
+            else:
+                result[key] = value
+    return result
+
+
+def reference_format_outline_as_html(outline):
+    if not outline:
+        return ""
+    html_parts = ["<div class='content-outline'>"]
+    for item in outline:
+        level = "h2" if item.strip().startswith(('1.', '2.', '3.', '4.', '5.')) else "h3"
+        clean_item = item.strip().lstrip('1234567890.-•abcdefgh').strip()
+        html_parts.append(f"<{level}>{clean_item}</{level}>")
+    html_parts.append("</div>")
+    return "\n".join(html_parts)
+
+
+def reference_text_similarity(text1, text2):
+    if not text1 or not text2:
+        return 0.0
+    words1 = set(text1.lower().split())
+    words2 = set(text2.lower().split())
+    union = len(words1.union(words2))
+    return len(words1.intersection(words2)) / union if union > 0 else 0.0
+
+
+def random_text(rng, alphabet, max_length):
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+# ===== validate_seo_elements =====
+
+def test_validate_seo_elements_boundaries():
+    """Every title length 0-79 and meta length 0-169 scores like the original checks"""
+    for title_length in range(80):
+        for meta_length in range(170):
+            title = "t" * title_length
+            meta = "m" * meta_length
+            assert validate_seo_elements(title, meta) == reference_validate_seo_elements(title, meta), \
+                (title_length, meta_length)
+
+
+def test_validate_seo_elements_table():
+    cases = [
+        # (title length, meta length, title score, meta score, title valid, meta valid)
+        (0, 0, 0, 0, False, False),
+        (29, 119, 80, 85, True, True),
+        (30, 120, 100, 100, True, True),
+        (60, 155, 100, 100, True, True),
+        (61, 156, 90, 90, True, True),
+    ]
+    for title_length, meta_length, title_score, meta_score, title_valid, meta_valid in cases:
+        results = validate_seo_elements("t" * title_length, "m" * meta_length)
+        assert results["title"]["score"] == title_score, title_length
+        assert results["meta_description"]["score"] == meta_score, meta_length
+        assert results["title"]["valid"] is title_valid
+        assert results["meta_description"]["valid"] is meta_valid
+
+
+# ===== extract_keywords_from_text =====
+
+def test_extract_keywords_table():
+    assert extract_keywords_from_text("") == []
+    assert extract_keywords_from_text("SEO tips for <b>Content</b> marketing, content!") == ["Tips", "Content", "Marketing"]
+    assert extract_keywords_from_text("word2vec café naïve naïve", min_length=4) == ["Café", "Naïve"]
+    assert extract_keywords_from_text("abc abcd", min_length=3) == ["Abc", "Abcd"]
+
+
+def test_extract_keywords_matches_reference():
+    rng = random.Random(1)
+    alphabet = "abcdEFG xyz  .,!?-_<>/'\"é1\t"
+    for _ in range(5000):
+        text = random_text(rng, alphabet, 40)
+        min_length = rng.randint(1, 6)
+        assert extract_keywords_from_text(text, min_length) == reference_extract_keywords(text, min_length), text
+
+
+# ===== chunk_text =====
+
+def test_chunk_text_table():
+    assert chunk_text("") == []
+    assert chunk_text("short text", max_length=20) == ["short text"]
+    assert chunk_text("aaaa bbbb cccc", max_length=10, overlap=0) == ["aaaa bbbb", "cccc"]
+    assert chunk_text("abcdefghij", max_length=4, overlap=0) == ["abcd", "efgh", "ij"]
+
+
+def test_chunk_text_matches_reference():
+    rng = random.Random(2)
+    for _ in range(3000):
+        text = random_text(rng, "ab  c", 60)
+        max_length = rng.randint(1, 15)
+        overlap = rng.randint(0, 20)
+        assert chunk_text(text, max_length, overlap) == reference_chunk_text(text, max_length, overlap), \
+            (text, max_length, overlap)
+
+
+# ===== merge_dictionaries =====
+
+def test_merge_dictionaries_table():
+    assert merge_dictionaries() == {}
+    assert merge_dictionaries({"a": ""}, {"a": "x"}) == {"a": "x"}
+    assert merge_dictionaries({"a": "kept"}, {"a": "ignored"}) == {"a": "kept"}
+    assert merge_dictionaries({"a": [1]}, {"a": [2]}) == {"a": [1, 2]}
+    assert merge_dictionaries({"a": {"b": 1, "c": [1]}}, {"a": {"c": [2], "d": 3}}) == {"a": {"b": 1, "c": [1, 2], "d": 3}}
+
+
+def test_merge_dictionaries_matches_reference():
+    rng = random.Random(3)
+
+    def random_dict(depth=0):
+        d = {}
+        for key in rng.sample("abcd", rng.randint(0, 4)):
+            roll = rng.random()
+            if roll < 0.3 and depth < 3:
+                d[key] = random_dict(depth + 1)
+            elif roll < 0.5:
+                d[key] = [rng.randint(0, 2)]
+            elif roll < 0.6:
+                d[key] = []
+            else:
+                d[key] = rng.choice([0, 1, "", "x", {}])
+        return d
+
+    for _ in range(3000):
+        seed = rng.random()
+        # Build identical inputs twice, since both versions extend lists in place
+        inputs = []
+        for _ in range(2):
+            rng_state = rng.getstate()
+            rng.seed(seed)
+            inputs.append([random_dict() for _ in range(rng.randint(1, 4))])
+            rng.setstate(rng_state)
+
+        assert merge_dictionaries(*inputs[0]) == reference_merge_dictionaries(*inputs[1])
+        assert inputs[0] == inputs[1]
+
+
+# ===== format_outline_as_html =====
+
+def test_format_outline_as_html_table():
+    assert format_outline_as_html([]) == ""
+    assert format_outline_as_html(["1. Introduction", "a. Hook", "- Tip", "Plain"]) == "\n".join([
+        "<div class='content-outline'>",
+        "<h2>Introduction</h2>",
+        "<h3>Hook</h3>",
+        "<h3>Tip</h3>",
+        "<h3>Plain</h3>",
+        "</div>"
+    ])
+    # Only 1.-5. are top-level sections
+    assert "<h3>Tools</h3>" in format_outline_as_html(["6. Tools"])
+
+
+def test_format_outline_as_html_matches_reference():
+    rng = random.Random(4)
+    alphabet = " 12345.6-•abcx\t"
+    for _ in range(5000):
+        outline = [random_text(rng, alphabet, 6) for _ in range(rng.randint(0, 4))]
+        assert format_outline_as_html(outline) == reference_format_outline_as_html(outline), outline
+
+
+# ===== calculate_text_similarity =====
+
+def test_text_similarity_table():
+    assert calculate_text_similarity("", "seo") == 0.0
+    assert calculate_text_similarity("SEO tips", "seo TIPS") == 1.0
+    assert calculate_text_similarity("a b", "b c") == 1 / 3
+    assert calculate_text_similarity("a b", "c d") == 0.0
+
+
+def test_text_similarity_matches_reference():
+    rng = random.Random(5)
+    for _ in range(5000):
+        text1 = " ".join(random_text(rng, "aAbc", 2) for _ in range(rng.randint(0, 8)))
+        text2 = " ".join(random_text(rng, "abC", 2) for _ in range(rng.randint(0, 8)))
+        assert calculate_text_similarity(text1, text2) == reference_text_similarity(text1, text2), (text1, text2)
+
+
+def main():
+    """Run all tests in this module"""
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_") and callable(func)]
+    failed = 0
+
+    for name, func in tests:
+        try:
+            func()
+            print(f"✅ {name}")
+        except Exception:
+            failed += 1
+            print(f"❌ {name}")
+            traceback.print_exc()
+
+    print(f"\nOverall: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)